@@ -3,73 +3,126 @@
 Check Mem0 library version and available configuration parameters.
 """
 
-import sys
-import inspect
+import json
+import hashlib
+import argparse
+import importlib
+import importlib.metadata
+import importlib.util
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional
 
-def check_mem0_version():
-    """Check Mem0 library version and configuration options."""
-    print("🔍 Checking Mem0 Library")
-    print("=" * 30)
-    
+# Introspection results are cached here, keyed on the installed mem0ai version
+CACHE_FILE = Path.home() / '.cache' / 'mcp-mem0' / 'mem0_sig.json'
+
+CONFIG_CLASSES = ('BaseEmbedderConfig', 'BaseLLMConfig', 'EmbedderConfig')
+BASE_URL_CLASSES = ('BaseEmbedderConfig', 'BaseLLMConfig')
+
+@lru_cache(maxsize=None)
+def _sig(cls):
+    """Return the (cached) signature of a config class's __init__."""
+    # inspect is only needed once mem0 has imported successfully
+    import inspect
+    return inspect.signature(cls.__init__)
+
+def _cache_key() -> Optional[str]:
+    """Key the cache on the installed mem0ai distribution without importing it."""
+    try:
+        version = importlib.metadata.version('mem0ai')
+    except importlib.metadata.PackageNotFoundError:
+        return None
+    return hashlib.blake2b(version.encode()).hexdigest()
+
+def _load_cache(key: str) -> Optional[Dict[str, Any]]:
+    """Return cached introspection results for the given key, if any."""
+    try:
+        cached = json.loads(CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return None
+    return cached.get('info') if cached.get('key') == key else None
+
+def _save_cache(key: str, info: Dict[str, Any]):
+    """Persist introspection results; failures only cost a re-import next time."""
     try:
-        import mem0
-        print(f"✅ Mem0 version: {mem0.__version__}")
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        CACHE_FILE.write_text(json.dumps({'key': key, 'info': info}))
+    except OSError:
+        pass
+
+def _introspect() -> Dict[str, Any]:
+    """Import mem0 and collect its version and config class parameters."""
+    import mem0
+    from mem0 import Memory
+    
+    info = {
+        'version': mem0.__version__,
+        'memory_class': repr(Memory),
+        'classes': {}
+    }
+    
+    # Check if we can inspect the configuration classes
+    # Probe mem0.config once and look the classes up by name, rather than
+    # paying for a failed import per missing class on older mem0 versions
+    config_module = None
+    if importlib.util.find_spec('mem0.config') is not None:
+        config_module = importlib.import_module('mem0.config')
+    
+    for name in CONFIG_CLASSES:
+        cls = getattr(config_module, name, None)
+        if cls is None:
+            info['classes'][name] = {'error': f"{name} is not available in mem0.config"}
+            continue
         
-        # Check Memory class
-        from mem0 import Memory
-        print(f"✅ Memory class: {Memory}")
+        info['classes'][name] = {
+            'repr': repr(cls),
+            'parameters': list(_sig(cls).parameters.keys())
+        }
+    
+    return info
+
+def _report(info: Dict[str, Any]):
+    """Print introspection results."""
+    print(f"✅ Mem0 version: {info['version']}")
+    print(f"✅ Memory class: {info['memory_class']}")
+    
+    for name, details in info['classes'].items():
+        if 'error' in details:
+            print(f"⚠️  Could not import {name}: {details['error']}")
+            continue
         
-        # Check if we can inspect the configuration classes
-        try:
-            from mem0.config import BaseEmbedderConfig
-            print(f"✅ BaseEmbedderConfig: {BaseEmbedderConfig}")
-            
-            # Get the __init__ signature
-            sig = inspect.signature(BaseEmbedderConfig.__init__)
-            print(f"✅ BaseEmbedderConfig.__init__ parameters: {list(sig.parameters.keys())}")
-            
-            # Check if base_url is supported
-            if 'base_url' in sig.parameters:
-                print("✅ base_url parameter is supported in BaseEmbedderConfig")
-            else:
-                print("❌ base_url parameter is NOT supported in BaseEmbedderConfig")
-                print("   This explains the error you're seeing!")
-                
-        except ImportError as e:
-            print(f"⚠️  Could not import BaseEmbedderConfig: {e}")
+        print(f"✅ {name}: {details['repr']}")
+        print(f"✅ {name}.__init__ parameters: {details['parameters']}")
         
-        # Check LLM config
-        try:
-            from mem0.config import BaseLLMConfig
-            print(f"✅ BaseLLMConfig: {BaseLLMConfig}")
-            
-            sig = inspect.signature(BaseLLMConfig.__init__)
-            print(f"✅ BaseLLMConfig.__init__ parameters: {list(sig.parameters.keys())}")
-            
-            if 'base_url' in sig.parameters:
-                print("✅ base_url parameter is supported in BaseLLMConfig")
+        # Check if base_url is supported
+        if name in BASE_URL_CLASSES:
+            if 'base_url' in details['parameters']:
+                print(f"✅ base_url parameter is supported in {name}")
             else:
-                print("❌ base_url parameter is NOT supported in BaseLLMConfig")
-                
-        except ImportError as e:
-            print(f"⚠️  Could not import BaseLLMConfig: {e}")
-        
-        # Check what embedder providers are available
-        try:
-            from mem0.config import EmbedderConfig
-            print(f"✅ EmbedderConfig: {EmbedderConfig}")
-            
-            sig = inspect.signature(EmbedderConfig.__init__)
-            print(f"✅ EmbedderConfig.__init__ parameters: {list(sig.parameters.keys())}")
-            
-        except ImportError as e:
-            print(f"⚠️  Could not import EmbedderConfig: {e}")
-        
-        print("\n📋 Recommendations:")
-        print("1. The embedder configuration doesn't support base_url parameter")
-        print("2. Use environment variables (OPENAI_BASE_URL) instead")
-        print("3. This is the correct approach for Mem0 library")
-        
+                print(f"❌ base_url parameter is NOT supported in {name}")
+                if name == 'BaseEmbedderConfig':
+                    print("   This explains the error you're seeing!")
+    
+    print("\n📋 Recommendations:")
+    print("1. The embedder configuration doesn't support base_url parameter")
+    print("2. Use environment variables (OPENAI_BASE_URL) instead")
+    print("3. This is the correct approach for Mem0 library")
+
+def check_mem0_version(force: bool = False):
+    """Check Mem0 library version and configuration options."""
+    print("🔍 Checking Mem0 Library")
+    print("=" * 30)
+    
+    key = _cache_key()
+    if key and not force:
+        info = _load_cache(key)
+        if info is not None:
+            print(f"ℹ️  Using cached results from {CACHE_FILE} (pass --force to refresh)")
+            _report(info)
+            return True
+    
+    try:
+        info = _introspect()
     except ImportError as e:
         print(f"❌ Could not import Mem0: {e}")
         print("Please install Mem0: pip install mem0ai")
@@ -78,7 +131,16 @@ def check_mem0_version():
         print(f"❌ Error checking Mem0: {e}")
         return False
     
+    if key:
+        _save_cache(key, info)
+    _report(info)
+    
     return True
 
 if __name__ == '__main__':
-    check_mem0_version()
+    parser = argparse.ArgumentParser(description='Check Mem0 library version and configuration options')
+    parser.add_argument('--force', '-f', action='store_true',
+                       help='Ignore cached results and re-inspect the installed mem0')
+    args = parser.parse_args()
+    
+    check_mem0_version(force=args.force)
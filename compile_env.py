@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Compile the .env file into a Python module for faster server startup.
+
+Writes src/_env_compiled.py containing the parsed values as literals, so the
+server can import them (and benefit from the bytecode cache) instead of
+re-parsing .env on every start. The server falls back to python-dotenv
+automatically whenever .env has changed since it was compiled.
+
+Re-run this script after every change to .env.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+from dotenv import dotenv_values
+
+COMPILED_MODULE = Path(__file__).parent / "src" / "_env_compiled.py"
+
+def compile_env(env_file: Path) -> bool:
+    """Compile the given .env file into src/_env_compiled.py."""
+    if not env_file.exists():
+        print(f"❌ {env_file} file not found!")
+        return False
+    
+    env_file = env_file.resolve()
+    values = {key: value for key, value in dotenv_values(env_file).items() if value is not None}
+    
+    parts = [
+        "# Generated by compile_env.py - do not edit, re-run the script instead.\n",
+        "# Contains secrets from .env: never commit this file.\n",
+        f"SOURCE_PATH = {str(env_file)!r}\n",
+        f"SOURCE_MTIME_NS = {env_file.stat().st_mtime_ns!r}\n",
+        "VALUES = {\n",
+    ]
+    parts.extend(f"    {key!r}: {value!r},\n" for key, value in values.items())
+    parts.append("}\n")
+    
+    COMPILED_MODULE.write_text("".join(parts))
+    os.chmod(COMPILED_MODULE, 0o600)
+    
+    print(f"✅ Compiled {len(values)} variables from {env_file}")
+    print(f"📁 Location: {COMPILED_MODULE}")
+    return True
+
+if __name__ == "__main__":
+    env_path = Path(sys.argv[1]) if len(sys.argv) > 1 else Path(".env")
+    if not compile_env(env_path):
+        sys.exit(1)
@@ -12,10 +12,11 @@ from dotenv import load_dotenv
 
 # Try to find and load the .env file
 env_path = Path(__file__).parent / ".env"
+env_exists = env_path.is_file()
 print(f"Looking for .env file at: {env_path}")
-print(f"File exists: {env_path.exists()}")
+print(f"File exists: {env_exists}")
 
-if env_path.exists():
+if env_exists:
     load_dotenv(env_path)
     print("✅ .env file loaded successfully")
 else:
@@ -27,8 +28,8 @@ else:
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+from env_scan import SENSITIVE_KEYS, snapshot_env
 from utils import get_mem0_client
-from mem0 import Memory
 
 def test_mem0_directly():
     """Test Mem0 client directly without MCP server."""
@@ -37,22 +38,19 @@ def test_mem0_directly():
     try:
         # Test 1: Check environment variables
         print("1. Checking environment variables:")
-        env_vars = [
+        snapshot = snapshot_env([
             'LLM_PROVIDER', 'LLM_API_KEY', 'LLM_CHOICE', 
             'EMBEDDING_MODEL_CHOICE', 'LLM_BASE_URL', 'DATABASE_URL'
-        ]
+        ])
         
-        for var in env_vars:
-            value = os.getenv(var)
-            if value:
-                # Mask sensitive values
-                if 'API_KEY' in var or 'DATABASE_URL' in var:
-                    masked_value = value[:10] + "..." if len(value) > 10 else "***"
-                    print(f"   {var}: {masked_value}")
-                else:
-                    print(f"   {var}: {value}")
-            else:
-                print(f"   {var}: NOT SET")
+        # Mask sensitive values
+        display = {
+            var: (value[:10] + "..." if len(value) > 10 else "***") if var in SENSITIVE_KEYS else value
+            for var, value in snapshot.items() if value
+        }
+        
+        for var in snapshot:
+            print(f"   {var}: {display.get(var, 'NOT SET')}")
         
         print()
         
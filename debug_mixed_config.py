@@ -9,6 +9,15 @@ import sys
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+from env_scan import SENSITIVE_KEYS, scan_env_file, snapshot_env
+
+ENV_VARS = [
+    'LLM_PROVIDER', 'LLM_BASE_URL', 'LLM_API_KEY',
+    'EMBEDDING_PROVIDER', 'EMBEDDING_BASE_URL', 'EMBEDDING_API_KEY',
+    'EMBEDDING_MODEL_CHOICE', 'OPENAI_BASE_URL', 'OPENAI_API_KEY',
+    'OLLAMA_BASE_URL'
+]
+
 def debug_mixed_config():
     """Debug mixed configuration."""
     print("🔍 Debugging Mixed Configuration")
@@ -20,19 +29,21 @@ def debug_mixed_config():
             from dotenv import load_dotenv
             load_dotenv()
         except ImportError:
-            print("⚠️  dotenv not available, using system environment variables")
+            if os.path.exists('.env'):
+                print("⚠️  dotenv not available, reading known keys from .env directly")
+                for key, value in scan_env_file('.env').items():
+                    os.environ.setdefault(key, value)
+            else:
+                print("⚠️  dotenv not available, using system environment variables")
+        
+        env = snapshot_env(ENV_VARS)
         
         print("📋 Environment Variables:")
-        print(f"  LLM_PROVIDER: {os.getenv('LLM_PROVIDER', 'NOT SET')}")
-        print(f"  LLM_BASE_URL: {os.getenv('LLM_BASE_URL', 'NOT SET')}")
-        print(f"  LLM_API_KEY: {'SET' if os.getenv('LLM_API_KEY') else 'NOT SET'}")
-        print(f"  EMBEDDING_PROVIDER: {os.getenv('EMBEDDING_PROVIDER', 'NOT SET')}")
-        print(f"  EMBEDDING_BASE_URL: {os.getenv('EMBEDDING_BASE_URL', 'NOT SET')}")
-        print(f"  EMBEDDING_API_KEY: {'SET' if os.getenv('EMBEDDING_API_KEY') else 'NOT SET'}")
-        print(f"  EMBEDDING_MODEL_CHOICE: {os.getenv('EMBEDDING_MODEL_CHOICE', 'NOT SET')}")
-        print(f"  OPENAI_BASE_URL: {os.getenv('OPENAI_BASE_URL', 'NOT SET')}")
-        print(f"  OPENAI_API_KEY: {'SET' if os.getenv('OPENAI_API_KEY') else 'NOT SET'}")
-        print(f"  OLLAMA_BASE_URL: {os.getenv('OLLAMA_BASE_URL', 'NOT SET')}")
+        for var, value in env.items():
+            if var in SENSITIVE_KEYS:
+                print(f"  {var}: {'SET' if value else 'NOT SET'}")
+            else:
+                print(f"  {var}: {value if value is not None else 'NOT SET'}")
         print()
         
         # Test configuration building
@@ -40,8 +51,8 @@ def debug_mixed_config():
         from utils import get_mem0_client
         
         print("\n📊 Configuration Analysis:")
-        llm_provider = os.getenv('LLM_PROVIDER', 'openai')
-        embedding_provider = os.getenv('EMBEDDING_PROVIDER', llm_provider)
+        llm_provider = env['LLM_PROVIDER'] or 'openai'
+        embedding_provider = env['EMBEDDING_PROVIDER'] or llm_provider
         
         print(f"  LLM Provider: {llm_provider}")
         print(f"  Embedding Provider: {embedding_provider}")
@@ -52,7 +63,7 @@ def debug_mixed_config():
             print("  📍 Embedder will use OpenAI")
             
             # Check if we have the right base URL for OpenAI
-            embedding_base_url = os.getenv('EMBEDDING_BASE_URL') or os.getenv('LLM_BASE_URL')
+            embedding_base_url = env['EMBEDDING_BASE_URL'] or env['LLM_BASE_URL']
             if embedding_base_url and 'api.openai.com' not in embedding_base_url:
                 print(f"  ✅ Custom OpenAI endpoint: {embedding_base_url}")
             else:
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for inspecting environment configuration in the debug scripts.
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+# Variables whose values should never be printed in full
+SENSITIVE_KEYS = frozenset({
+    'LLM_API_KEY', 'EMBEDDING_API_KEY', 'OPENAI_API_KEY', 'DATABASE_URL'
+})
+
+# Matches every configuration key the scripts care about in a single pass over an .env file
+ENV_KEY_RE = re.compile(
+    r'^[ \t]*(LLM_PROVIDER|EMBEDDING_PROVIDER|LLM_BASE_URL|EMBEDDING_BASE_URL'
+    r'|LLM_API_KEY|EMBEDDING_API_KEY|OPENAI_API_KEY|OPENAI_BASE_URL|OLLAMA_BASE_URL'
+    r'|EMBEDDING_MODEL_CHOICE|DATABASE_URL)=(.*)$',
+    re.M
+)
+
+def clean_value(value: str) -> str:
+    """Strip surrounding whitespace and one matching pair of quotes from an .env value."""
+    value = value.strip()
+    if len(value) >= 2 and value[0] in "\"'" and value[-1] == value[0]:
+        value = value[1:-1]
+    return value
+
+def snapshot_env(keys: Iterable[str]) -> Dict[str, Optional[str]]:
+    """Collect the current values of the given environment variables in one pass."""
+    env = os.environ
+    return {key: env.get(key) for key in keys}
+
+def scan_env_file(path) -> Dict[str, str]:
+    """
+    Parse the known configuration keys out of an .env file.
+    
+    Args:
+        path: Path to the .env file
+    
+    Returns:
+        Dict mapping each key found to its unquoted value (first occurrence wins)
+    """
+    text = Path(path).read_bytes().decode()
+    values: Dict[str, str] = {}
+    for match in ENV_KEY_RE.finditer(text):
+        values.setdefault(match.group(1), clean_value(match.group(2)))
+    return values
@@ -4,53 +4,65 @@ Script to fix the embedding configuration for Ollama setup.
 This ensures the system uses Ollama for both LLM and embeddings.
 """
 
-import os
 import sys
+from functools import lru_cache
+from pathlib import Path
+
+from env_scan import ENV_KEY_RE, snapshot_env
+
+EMBEDDING_PROVIDER_BLOCK = (
+    '\n# The provider for your embedding model\n'
+    '# Set this to either openai, openrouter, or ollama\n'
+    '# If not set, will use the same provider as LLM_PROVIDER\n'
+    'EMBEDDING_PROVIDER=ollama\n'
+)
+
+@lru_cache(maxsize=8)
+def _read_env_text(path: Path, mtime_ns: int, size: int) -> str:
+    """Read an .env file; cached on (path, mtime, size) so unchanged files are read once."""
+    return path.read_text()
+
+def read_env_text(path: Path) -> str:
+    """Return the contents of an .env file, reusing the cached read when the file is unchanged."""
+    st = path.stat()
+    return _read_env_text(path, st.st_mtime_ns, st.st_size)
 
 def fix_embedding_config():
     """Add EMBEDDING_PROVIDER=ollama to .env file if missing."""
     
-    env_file = '.env'
+    env_file = Path('.env')
     
-    if not os.path.exists(env_file):
+    if not env_file.exists():
         print(f"ERROR: {env_file} file not found!")
         return False
     
     # Read current .env file
-    with open(env_file, 'r') as f:
-        lines = f.readlines()
+    text = read_env_text(env_file)
     
-    # Check if EMBEDDING_PROVIDER is already set
-    embedding_provider_set = False
-    for line in lines:
-        if line.strip().startswith('EMBEDDING_PROVIDER='):
-            embedding_provider_set = True
-            break
+    # Locate the first LLM_PROVIDER and EMBEDDING_PROVIDER lines in one scan
+    matches = {}
+    for m in ENV_KEY_RE.finditer(text):
+        matches.setdefault(m.group(1), m)
     
-    if embedding_provider_set:
+    if 'EMBEDDING_PROVIDER' in matches:
         print("EMBEDDING_PROVIDER is already configured in .env file")
         return True
     
-    # Find where to insert the EMBEDDING_PROVIDER setting
-    insert_index = -1
-    for i, line in enumerate(lines):
-        if line.strip().startswith('LLM_PROVIDER='):
-            insert_index = i + 1
-            break
-    
-    if insert_index == -1:
+    llm_match = matches.get('LLM_PROVIDER')
+    if llm_match is None:
         print("ERROR: Could not find LLM_PROVIDER in .env file")
         return False
     
-    # Insert EMBEDDING_PROVIDER setting
-    lines.insert(insert_index, '\n# The provider for your embedding model\n')
-    lines.insert(insert_index + 1, '# Set this to either openai, openrouter, or ollama\n')
-    lines.insert(insert_index + 2, '# If not set, will use the same provider as LLM_PROVIDER\n')
-    lines.insert(insert_index + 3, 'EMBEDDING_PROVIDER=ollama\n')
+    # Insert EMBEDDING_PROVIDER setting after the LLM_PROVIDER line
+    insert_at = llm_match.end()
+    if insert_at < len(text):
+        insert_at += 1  # keep the LLM_PROVIDER line's own newline
+        new_text = text[:insert_at] + EMBEDDING_PROVIDER_BLOCK + text[insert_at:]
+    else:
+        new_text = text + '\n' + EMBEDDING_PROVIDER_BLOCK
     
     # Write updated .env file
-    with open(env_file, 'w') as f:
-        f.writelines(lines)
+    env_file.write_text(new_text)
     
     print("✅ Added EMBEDDING_PROVIDER=ollama to .env file")
     print("✅ This should fix the OpenAI API key error")
@@ -67,10 +79,14 @@ def verify_config():
     print("\n🔍 Verifying current configuration...")
     
     # Check environment variables
-    llm_provider = os.getenv('LLM_PROVIDER')
-    embedding_provider = os.getenv('EMBEDDING_PROVIDER')
-    llm_base_url = os.getenv('LLM_BASE_URL')
-    embedding_model = os.getenv('EMBEDDING_MODEL_CHOICE')
+    env = snapshot_env([
+        'LLM_PROVIDER', 'EMBEDDING_PROVIDER', 'LLM_BASE_URL',
+        'EMBEDDING_MODEL_CHOICE', 'OPENAI_API_KEY', 'OPENAI_BASE_URL'
+    ])
+    llm_provider = env['LLM_PROVIDER']
+    embedding_provider = env['EMBEDDING_PROVIDER']
+    llm_base_url = env['LLM_BASE_URL']
+    embedding_model = env['EMBEDDING_MODEL_CHOICE']
     
     print(f"  LLM_PROVIDER: {llm_provider}")
     print(f"  EMBEDDING_PROVIDER: {embedding_provider}")
@@ -78,8 +94,8 @@ def verify_config():
     print(f"  EMBEDDING_MODEL_CHOICE: {embedding_model}")
     
     # Check for conflicting OpenAI settings
-    openai_key = os.getenv('OPENAI_API_KEY')
-    openai_base = os.getenv('OPENAI_BASE_URL')
+    openai_key = env['OPENAI_API_KEY']
+    openai_base = env['OPENAI_BASE_URL']
     
     if openai_key:
         print(f"  ⚠️  OPENAI_API_KEY: SET (this might cause conflicts)")
@@ -5,8 +5,33 @@ This ensures the system uses your custom OpenAI endpoint instead of api.openai.c
 """
 
 import os
+import re
 import sys
 
+from env_scan import clean_value
+
+# Set MCP_VERBOSE=0 to skip the current-configuration listing
+VERBOSE = os.getenv("MCP_VERBOSE", "1") == "1"
+
+# Keys inspected by fix_openai_config()
+CONFIG_KEYS = ('LLM_PROVIDER', 'EMBEDDING_PROVIDER', 'LLM_BASE_URL', 'LLM_API_KEY')
+
+# Anchored so non-matching lines are rejected on their first characters
+CONFIG_KEY_RE = re.compile(r'^(?:%s)=' % '|'.join(CONFIG_KEYS))
+
+def iter_config_values(lines):
+    """Yield (key, unquoted value) for each of CONFIG_KEYS, stopping once all have been found."""
+    remaining = set(CONFIG_KEYS)
+    for line in lines:
+        if not CONFIG_KEY_RE.match(line):
+            continue
+        key, _, value = line.partition('=')
+        if key in remaining:
+            yield key, clean_value(value)
+            remaining.discard(key)
+            if not remaining:
+                return
+
 def fix_openai_config():
     """Fix OpenAI configuration for custom endpoints."""
     
@@ -16,40 +41,28 @@ def fix_openai_config():
         print(f"ERROR: {env_file} file not found!")
         return False
     
-    # Read current .env file
+    # Stream the .env file; the scan stops reading once every key has been found
     with open(env_file, 'r') as f:
-        content = f.read()
+        config = dict(iter_config_values(f))
     
     # Check current configuration
-    print("🔍 Current Configuration:")
-    print("=" * 40)
-    
-    lines = content.split('\n')
-    for line in lines:
-        if any(key in line for key in ['LLM_PROVIDER', 'EMBEDDING_PROVIDER', 'LLM_BASE_URL', 'LLM_API_KEY']):
-            if 'API_KEY' in line and '=' in line:
-                key, value = line.split('=', 1)
+    if VERBOSE:
+        print("🔍 Current Configuration:")
+        print("=" * 40)
+        
+        for key, value in config.items():
+            if 'API_KEY' in key:
                 print(f"  {key}={value[:8]}..." if len(value) > 8 else f"  {key}={value}")
             else:
-                print(f"  {line}")
-    
-    print()
+                print(f"  {key}={value}")
+        
+        print()
     
     # Check if configuration is correct
-    llm_provider = None
-    llm_base_url = None
-    llm_api_key = None
-    embedding_provider = None
-    
-    for line in lines:
-        if line.startswith('LLM_PROVIDER='):
-            llm_provider = line.split('=', 1)[1].strip()
-        elif line.startswith('LLM_BASE_URL='):
-            llm_base_url = line.split('=', 1)[1].strip().strip("'\"")
-        elif line.startswith('LLM_API_KEY='):
-            llm_api_key = line.split('=', 1)[1].strip()
-        elif line.startswith('EMBEDDING_PROVIDER='):
-            embedding_provider = line.split('=', 1)[1].strip()
+    llm_provider = config.get('LLM_PROVIDER')
+    llm_base_url = config.get('LLM_BASE_URL')
+    llm_api_key = config.get('LLM_API_KEY')
+    embedding_provider = config.get('EMBEDDING_PROVIDER')
     
     print("🔧 Configuration Analysis:")
     print("=" * 40)
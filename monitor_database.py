@@ -7,9 +7,12 @@ Provides real-time monitoring of database connections and health.
 import os
 import sys
 import time
+import atexit
 import json
+import logging
 import argparse
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any
 
 # Add src directory to path
@@ -18,12 +21,30 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 from database_manager import get_database_manager, close_database_manager
 from health_check import get_health_checker
 
-def format_uptime(seconds: float) -> str:
-    """Format uptime in human-readable format."""
-    days = int(seconds // 86400)
-    hours = int((seconds % 86400) // 3600)
-    minutes = int((seconds % 3600) // 60)
-    seconds = int(seconds % 60)
+try:
+    import orjson
+    
+    def dumps_json(data: Any) -> str:
+        """Serialize to indented JSON using orjson's C encoder."""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str).decode()
+except ImportError:
+    # Fallback if orjson is not available
+    def dumps_json(data: Any) -> str:
+        """Serialize to indented JSON."""
+        return json.dumps(data, indent=2, default=str)
+
+# ANSI escape: clear screen and move cursor home
+CLEAR_SCREEN = "\x1b[2J\x1b[H"
+
+# Close the shared database pool once at interpreter exit rather than after every check
+atexit.register(close_database_manager)
+
+@lru_cache(maxsize=128)
+def _format_uptime_seconds(seconds: int) -> str:
+    """Format a whole number of seconds; cached since it only changes once per second."""
+    days, seconds = divmod(seconds, 86400)
+    hours, seconds = divmod(seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
     
     if days > 0:
         return f"{days}d {hours}h {minutes}m {seconds}s"
@@ -34,51 +55,91 @@ def format_uptime(seconds: float) -> str:
     else:
         return f"{seconds}s"
 
+def format_uptime(seconds: float) -> str:
+    """Format uptime in human-readable format."""
+    return _format_uptime_seconds(int(seconds))
+
+# Dashboard templates, filled from one flattened dict per frame
+RULE = "=" * 60
+
+STATUS_TEMPLATE = f"""
+{RULE}
+MCP-MEM0 DATABASE MONITORING DASHBOARD
+{RULE}
+Timestamp: {{timestamp}}
+
+SERVICE STATUS:
+  Status: {{status_label}}
+  Uptime: {{uptime_human}}
+  Memory: {{memory_usage_mb:.1f}} MB
+  Version: {{version}}
+
+DATABASE STATUS:
+  Health: {{health_label}}
+  Last Check: {{last_check}}
+  Response Time: {{response_time_ms:.2f}} ms
+"""
+
+POOL_TEMPLATE = """
+CONNECTION POOL:
+  Active: {active_connections}
+  Idle: {idle_connections}
+  Available: {available_connections}
+  Total: {total_connections}
+  Utilization: {pool_utilization}
+  Min Pool: {min_connections}
+  Max Pool: {max_connections}"""
+
+POOL_ERROR_TEMPLATE = """
+  Pool Error: {pool_error}"""
+
+ERROR_TEMPLATE = """
+
+ERRORS:
+  {error_message}"""
+
+STATUS_DEFAULTS = {
+    'status': 'unknown',
+    'uptime_human': 'unknown',
+    'memory_usage_mb': 0,
+    'version': 'unknown',
+    'last_check': 'never',
+    'response_time_ms': 0,
+    'active_connections': 0,
+    'idle_connections': 0,
+    'available_connections': 0,
+    'total_connections': 0,
+    'pool_utilization': '0%',
+    'min_connections': 0,
+    'max_connections': 0,
+    'error_message': None,
+}
+
 def print_status_table(health_data: Dict[str, Any]):
     """Print a formatted status table."""
-    print("\n" + "="*60)
-    print("MCP-MEM0 DATABASE MONITORING DASHBOARD")
-    print("="*60)
-    print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print()
-    
-    # Service Status
     service = health_data.get('service', {})
-    print("SERVICE STATUS:")
-    print(f"  Status: {service.get('status', 'unknown').upper()}")
-    print(f"  Uptime: {service.get('uptime_human', 'unknown')}")
-    print(f"  Memory: {service.get('memory_usage_mb', 0):.1f} MB")
-    print(f"  Version: {service.get('version', 'unknown')}")
-    print()
-    
-    # Database Status
     database = health_data.get('database', {})
-    print("DATABASE STATUS:")
-    print(f"  Health: {'✓ HEALTHY' if database.get('is_healthy') else '✗ UNHEALTHY'}")
-    print(f"  Last Check: {database.get('last_check', 'never')}")
-    print(f"  Response Time: {database.get('response_time_ms', 0):.2f} ms")
-    print()
+    pool_stats = database.get('pool_stats', {})
+    
+    flat = {**STATUS_DEFAULTS, **service, **database, **pool_stats}
+    flat['timestamp'] = datetime.now().isoformat(sep=' ', timespec='seconds')
+    flat['status_label'] = flat['status'].upper()
+    flat['health_label'] = '✓ HEALTHY' if database.get('is_healthy') else '✗ UNHEALTHY'
+    
+    parts = [STATUS_TEMPLATE.format_map(flat)]
     
     # Connection Pool Stats
-    pool_stats = database.get('pool_stats', {})
     if 'error' not in pool_stats:
-        print("CONNECTION POOL:")
-        print(f"  Active: {pool_stats.get('active_connections', 0)}")
-        print(f"  Available: {pool_stats.get('available_connections', 0)}")
-        print(f"  Total: {pool_stats.get('total_connections', 0)}")
-        print(f"  Utilization: {pool_stats.get('pool_utilization', '0%')}")
-        print(f"  Min Pool: {pool_stats.get('min_connections', 0)}")
-        print(f"  Max Pool: {pool_stats.get('max_connections', 0)}")
+        parts.append(POOL_TEMPLATE.format_map(flat))
     else:
-        print(f"  Pool Error: {pool_stats.get('error')}")
+        parts.append(POOL_ERROR_TEMPLATE.format(pool_error=pool_stats['error']))
     
     # Error Information
     if database.get('error_message'):
-        print()
-        print("ERRORS:")
-        print(f"  {database.get('error_message')}")
+        parts.append(ERROR_TEMPLATE.format(error_message=database['error_message']))
     
-    print("="*60)
+    parts.append("\n" + RULE + "\n")
+    sys.stdout.write("".join(parts))
 
 def monitor_continuous(interval: int = 30):
     """Continuously monitor database status."""
@@ -86,30 +147,38 @@ def monitor_continuous(interval: int = 30):
     print(f"Refresh interval: {interval} seconds")
     print("Press Ctrl+C to stop")
     
-    try:
-        while True:
-            try:
-                health_checker = get_health_checker()
-                health_data = health_checker.get_detailed_status()
-                print_status_table(health_data)
-                
-                # Clear screen for next update (optional)
-                if os.name == 'nt':  # Windows
-                    os.system('cls')
-                else:  # Unix/Linux/Mac
-                    os.system('clear')
-                
-                time.sleep(interval)
-                
-            except KeyboardInterrupt:
-                print("\nMonitoring stopped by user")
-                break
-            except Exception as e:
-                print(f"\nError during monitoring: {e}")
-                time.sleep(5)  # Wait before retrying
-                
-    finally:
-        close_database_manager()
+    if os.name == 'nt':
+        # Enable ANSI escape handling in the Windows console
+        os.system('')
+    
+    health_checker = get_health_checker()
+    
+    # Schedule frames against a monotonic deadline so slow checks don't shift the cadence
+    next_tick = time.monotonic()
+    
+    while True:
+        try:
+            health_data = health_checker.get_detailed_status()
+            
+            # Clear screen before drawing the next frame
+            sys.stdout.write(CLEAR_SCREEN)
+            print_status_table(health_data)
+            sys.stdout.flush()
+            
+            next_tick += interval
+            now = time.monotonic()
+            if next_tick < now:
+                # Check overran a whole interval; resync instead of bursting to catch up
+                next_tick = now
+            time.sleep(next_tick - now)
+            
+        except KeyboardInterrupt:
+            print("\nMonitoring stopped by user")
+            break
+        except Exception as e:
+            print(f"\nError during monitoring: {e}")
+            time.sleep(5)  # Wait before retrying
+            next_tick = time.monotonic()
 
 def monitor_single():
     """Run a single health check."""
@@ -130,8 +199,6 @@ def monitor_single():
     except Exception as e:
         print(f"Health check failed: {e}")
         sys.exit(3)
-    finally:
-        close_database_manager()
 
 def export_metrics(output_file: str):
     """Export metrics to JSON file."""
@@ -143,15 +210,13 @@ def export_metrics(output_file: str):
         health_data['export_timestamp'] = datetime.now().isoformat()
         
         with open(output_file, 'w') as f:
-            json.dump(health_data, f, indent=2, default=str)
+            f.write(dumps_json(health_data))
         
         print(f"Metrics exported to {output_file}")
         
     except Exception as e:
         print(f"Failed to export metrics: {e}")
         sys.exit(1)
-    finally:
-        close_database_manager()
 
 def main():
     """Main entry point."""
@@ -167,9 +232,13 @@ def main():
     
     args = parser.parse_args()
     
-    # Load environment variables
-    from dotenv import load_dotenv
-    load_dotenv()
+    # Database manager logs go to stderr so they never mix with --json output
+    logging.basicConfig(level=logging.INFO)
+    
+    # Load environment variables, unless the deployment already provides them
+    if not os.getenv('DATABASE_URL') and os.getenv('ENV') != 'prod':
+        from dotenv import load_dotenv
+        load_dotenv()
     
     if args.export:
         export_metrics(args.export)
@@ -180,11 +249,9 @@ def main():
             try:
                 health_checker = get_health_checker()
                 health_data = health_checker.get_detailed_status()
-                print(json.dumps(health_data, indent=2, default=str))
+                print(dumps_json(health_data))
             except Exception as e:
                 print(json.dumps({"error": str(e)}, indent=2))
-            finally:
-                close_database_manager()
         else:
             monitor_single()
 
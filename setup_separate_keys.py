@@ -7,6 +7,14 @@ This helps users set up different authentication for different services.
 import os
 import sys
 
+from env_scan import clean_value
+
+# Keys displayed and edited by this script
+CONFIG_KEYS = (
+    'LLM_PROVIDER', 'LLM_BASE_URL', 'LLM_API_KEY',
+    'EMBEDDING_PROVIDER', 'EMBEDDING_BASE_URL', 'EMBEDDING_API_KEY'
+)
+
 def setup_separate_keys():
     """Interactive setup for separate API keys."""
     
@@ -24,22 +32,26 @@ def setup_separate_keys():
         print("Please create a .env file first with your basic configuration.")
         return False
     
-    # Read current configuration
-    with open(env_file, 'r') as f:
-        content = f.read()
+    # Read current configuration once; updates are applied in memory and saved together
+    env_lines = load_env(env_file)
     
     print("📋 Current Configuration:")
     print("-" * 30)
     
-    lines = content.split('\n')
+    # Collect only the keys this script uses, stopping once all have been found
     current_config = {}
-    for line in lines:
-        if '=' in line and not line.strip().startswith('#'):
-            key, value = line.split('=', 1)
-            current_config[key.strip()] = value.strip().strip("'\"")
+    remaining = set(CONFIG_KEYS)
+    for line in env_lines:
+        key, sep, value = line.partition('=')
+        key = key.strip()
+        if sep and key in remaining:
+            current_config[key] = clean_value(value)
+            remaining.discard(key)
+            if not remaining:
+                break
     
     # Display current settings
-    for key in ['LLM_PROVIDER', 'LLM_BASE_URL', 'LLM_API_KEY', 'EMBEDDING_PROVIDER', 'EMBEDDING_BASE_URL', 'EMBEDDING_API_KEY']:
+    for key in CONFIG_KEYS:
         value = current_config.get(key, 'NOT SET')
         if 'API_KEY' in key and value != 'NOT SET':
             value = value[:8] + '...' if len(value) > 8 else value
@@ -57,13 +69,14 @@ def setup_separate_keys():
     
     choice = input("\nEnter your choice (1-5): ").strip()
     
+    changed = False
     if choice == '1':
-        setup_embedding_url(current_config)
+        changed = setup_embedding_url(current_config, env_lines)
     elif choice == '2':
-        setup_embedding_api_key(current_config)
+        changed = setup_embedding_api_key(current_config, env_lines)
     elif choice == '3':
-        setup_embedding_url(current_config)
-        setup_embedding_api_key(current_config)
+        changed = setup_embedding_url(current_config, env_lines)
+        changed = setup_embedding_api_key(current_config, env_lines) or changed
     elif choice == '4':
         show_examples()
     elif choice == '5':
@@ -73,10 +86,13 @@ def setup_separate_keys():
         print("Invalid choice. Please try again.")
         return False
     
+    if changed:
+        save_env(env_lines, env_file)
+    
     return True
 
-def setup_embedding_url(current_config):
-    """Setup separate embedding base URL."""
+def setup_embedding_url(current_config, env_lines):
+    """Setup separate embedding base URL. Returns True if env_lines was updated."""
     print("\n🌐 Setting up Embedding Base URL")
     print("-" * 35)
     
@@ -91,7 +107,7 @@ def setup_embedding_url(current_config):
         print("You already have an embedding base URL configured.")
         change = input("Do you want to change it? (y/n): ").strip().lower()
         if change != 'y':
-            return
+            return False
     
     print("Enter the embedding base URL (or press Enter to use LLM_BASE_URL):")
     print("Examples:")
@@ -102,13 +118,15 @@ def setup_embedding_url(current_config):
     new_url = input("\nEmbedding Base URL: ").strip()
     
     if new_url:
-        update_env_file('EMBEDDING_BASE_URL', new_url)
+        update_env(env_lines, 'EMBEDDING_BASE_URL', new_url)
         print(f"✅ Set EMBEDDING_BASE_URL to: {new_url}")
-    else:
-        print("ℹ️  Will use LLM_BASE_URL for embeddings")
+        return True
+    
+    print("ℹ️  Will use LLM_BASE_URL for embeddings")
+    return False
 
-def setup_embedding_api_key(current_config):
-    """Setup separate embedding API key."""
+def setup_embedding_api_key(current_config, env_lines):
+    """Setup separate embedding API key. Returns True if env_lines was updated."""
     print("\n🔑 Setting up Embedding API Key")
     print("-" * 35)
     
@@ -123,7 +141,7 @@ def setup_embedding_api_key(current_config):
         print("You already have an embedding API key configured.")
         change = input("Do you want to change it? (y/n): ").strip().lower()
         if change != 'y':
-            return
+            return False
     
     print("Enter the embedding API key (or press Enter to use LLM_API_KEY):")
     print("Examples:")
@@ -134,32 +152,32 @@ def setup_embedding_api_key(current_config):
     new_key = input("\nEmbedding API Key: ").strip()
     
     if new_key:
-        update_env_file('EMBEDDING_API_KEY', new_key)
+        update_env(env_lines, 'EMBEDDING_API_KEY', new_key)
         print(f"✅ Set EMBEDDING_API_KEY to: {new_key[:8]}...")
-    else:
-        print("ℹ️  Will use LLM_API_KEY for embeddings")
-
-def update_env_file(key, value):
-    """Update a key-value pair in the .env file."""
-    env_file = '.env'
+        return True
     
-    # Read current file
+    print("ℹ️  Will use LLM_API_KEY for embeddings")
+    return False
+
+def load_env(env_file='.env'):
+    """Read the .env file into a list of lines."""
     with open(env_file, 'r') as f:
-        lines = f.readlines()
-    
-    # Check if key already exists
-    key_found = False
+        return f.readlines()
+
+def update_env(lines, key, value):
+    """Set a key-value pair in the in-memory .env lines, appending it if missing."""
     for i, line in enumerate(lines):
-        if line.strip().startswith(f'{key}='):
+        line_key, sep, _ = line.lstrip().partition('=')
+        if sep and line_key == key:
             lines[i] = f'{key}={value}\n'
-            key_found = True
-            break
-    
-    # If key not found, add it
-    if not key_found:
-        lines.append(f'{key}={value}\n')
+            return
     
-    # Write back to file
+    if lines and not lines[-1].endswith('\n'):
+        lines[-1] += '\n'
+    lines.append(f'{key}={value}\n')
+
+def save_env(lines, env_file='.env'):
+    """Write the .env lines back to disk in a single write."""
     with open(env_file, 'w') as f:
         f.writelines(lines)
 
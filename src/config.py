@@ -4,11 +4,11 @@ Handles environment variables and provides safe defaults for development.
 """
 
 import os
+from functools import lru_cache
 from typing import Optional
 
-# Environment variables are now loaded in main.py before this module is imported
-# from dotenv import load_dotenv
-# load_dotenv()
+# Environment variables are loaded once, in main.py, before this module is imported.
+# This is the single source of settings; do not load .env again here.
 
 # Default values for development/testing only - should be overridden in production
 DEFAULT_USER_ID = os.getenv("DEFAULT_USER_ID", "default_user")
@@ -18,6 +18,8 @@ HOST = os.getenv("HOST", "0.0.0.0")
 PORT = int(os.getenv("PORT", "8050"))
 TRANSPORT = os.getenv("TRANSPORT", "sse")
 MCP_TIMEOUT = int(os.getenv("MCP_TIMEOUT", "300"))  # 5 minutes default timeout
+# Mem0 calls allowed to run at once; clamped to 1, since 0 would block every tool call forever
+MEM0_CONCURRENCY = max(1, int(os.getenv("MEM0_CONCURRENCY", "16")))
 
 # Mem0 configuration
 LLM_PROVIDER = os.getenv("LLM_PROVIDER", "openai")
@@ -51,76 +53,78 @@ DATABASE_RETRY_ATTEMPTS = int(os.getenv("DATABASE_RETRY_ATTEMPTS", "3"))
 DATABASE_RETRY_DELAY = float(os.getenv("DATABASE_RETRY_DELAY", "2.0"))
 DATABASE_MAX_RETRY_DELAY = float(os.getenv("DATABASE_MAX_RETRY_DELAY", "60.0"))
 
+# Response cache configuration (a TTL of 0 disables caching)
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "10000"))
+SEARCH_CACHE_TTL = float(os.getenv("SEARCH_CACHE_TTL", "300"))
+GET_ALL_CACHE_TTL = float(os.getenv("GET_ALL_CACHE_TTL", "300"))
+# Most memories get_all_memories reads for one user (Mem0's own get_all default is only 100);
+# clamped to 1, since 0 or less would report every non-empty list as truncated and empty
+GET_ALL_MAX_MEMORIES = max(1, int(os.getenv("GET_ALL_MAX_MEMORIES", "10000")))
+# Cosine similarity at which a search reuses the results of an earlier, similar query (0 disables)
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0"))
+
 # Logging configuration
 DEBUG = os.getenv("DEBUG", "false").lower() in ("true", "1", "yes", "on")
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
 
+# Deployment environment
+# Simple heuristic - can be enhanced based on your deployment setup
+IS_PRODUCTION = (
+    os.getenv("NODE_ENV") == "production" or
+    os.getenv("ENVIRONMENT") == "production" or
+    os.getenv("FLASK_ENV") == "production"
+)
+
 # LLM token configuration
 LLM_MAX_TOKENS = int(os.getenv("LLM_MAX_TOKENS", "200"))
 LLM_CONTEXT_LENGTH = int(os.getenv("LLM_CONTEXT_LENGTH", "2048"))
 
-def validate_config() -> list[str]:
-    """
-    Validate the configuration and return a list of warnings/errors.
-    
-    Returns:
-        List of configuration warnings or errors
-    """
-    warnings = []
-    
-    # Check for development defaults in production-like environments
-    # Note: DEFAULT_USER_ID is now optional and can use the default value
-    
-    if not LLM_API_KEY and LLM_PROVIDER not in ['ollama', 'azure']:
-        warnings.append(
-            "WARNING: No LLM API key provided. "
-            "Set LLM_API_KEY environment variable (can be empty for servers that don't require authentication)."
-        )
+# Configuration checks as (predicate, warning) pairs, in report order.
+# The settings above are frozen at import time, so the messages are built once here.
+# Note: DEFAULT_USER_ID is now optional and can use the default value
+_VALIDATORS = (
+    (lambda: not LLM_API_KEY and LLM_PROVIDER not in ('ollama', 'azure'),
+     "WARNING: No LLM API key provided. "
+     "Set LLM_API_KEY environment variable (can be empty for servers that don't require authentication)."),
     
     # Azure OpenAI specific validation
-    if LLM_PROVIDER == 'azure':
-        if not AZURE_OPENAI_API_KEY:
-            warnings.append(
-                "WARNING: Azure OpenAI requires AZURE_OPENAI_API_KEY. "
-                "Set AZURE_OPENAI_API_KEY environment variable."
-            )
-        if not AZURE_OPENAI_ENDPOINT:
-            warnings.append(
-                "WARNING: Azure OpenAI requires AZURE_OPENAI_ENDPOINT. "
-                "Set AZURE_OPENAI_ENDPOINT environment variable."
-            )
-        if not AZURE_OPENAI_DEPLOYMENT_NAME:
-            warnings.append(
-                "WARNING: Azure OpenAI requires AZURE_OPENAI_DEPLOYMENT_NAME. "
-                "Set AZURE_OPENAI_DEPLOYMENT_NAME environment variable."
-            )
+    (lambda: LLM_PROVIDER == 'azure' and not AZURE_OPENAI_API_KEY,
+     "WARNING: Azure OpenAI requires AZURE_OPENAI_API_KEY. "
+     "Set AZURE_OPENAI_API_KEY environment variable."),
+    (lambda: LLM_PROVIDER == 'azure' and not AZURE_OPENAI_ENDPOINT,
+     "WARNING: Azure OpenAI requires AZURE_OPENAI_ENDPOINT. "
+     "Set AZURE_OPENAI_ENDPOINT environment variable."),
+    (lambda: LLM_PROVIDER == 'azure' and not AZURE_OPENAI_DEPLOYMENT_NAME,
+     "WARNING: Azure OpenAI requires AZURE_OPENAI_DEPLOYMENT_NAME. "
+     "Set AZURE_OPENAI_DEPLOYMENT_NAME environment variable."),
     
-    if not DATABASE_URL:
-        warnings.append(
-            "WARNING: No database URL provided. "
-            "Set DATABASE_URL environment variable."
-        )
+    (lambda: not DATABASE_URL,
+     "WARNING: No database URL provided. "
+     "Set DATABASE_URL environment variable."),
     
     # Validate database connection settings
-    if DATABASE_POOL_SIZE < 1:
-        warnings.append(
-            "WARNING: DATABASE_POOL_SIZE should be at least 1. "
-            f"Current value: {DATABASE_POOL_SIZE}"
-        )
-    
-    if DATABASE_MAX_CONNECTIONS < DATABASE_POOL_SIZE:
-        warnings.append(
-            "WARNING: DATABASE_MAX_CONNECTIONS should be >= DATABASE_POOL_SIZE. "
-            f"Current values: pool_size={DATABASE_POOL_SIZE}, max_connections={DATABASE_MAX_CONNECTIONS}"
-        )
+    (lambda: DATABASE_POOL_SIZE < 1,
+     "WARNING: DATABASE_POOL_SIZE should be at least 1. "
+     f"Current value: {DATABASE_POOL_SIZE}"),
+    (lambda: DATABASE_MAX_CONNECTIONS < DATABASE_POOL_SIZE,
+     "WARNING: DATABASE_MAX_CONNECTIONS should be >= DATABASE_POOL_SIZE. "
+     f"Current values: pool_size={DATABASE_POOL_SIZE}, max_connections={DATABASE_MAX_CONNECTIONS}"),
+    (lambda: DATABASE_POOL_TIMEOUT < 5,
+     "WARNING: DATABASE_POOL_TIMEOUT should be at least 5 seconds. "
+     f"Current value: {DATABASE_POOL_TIMEOUT}"),
+)
+
+@lru_cache(maxsize=1)
+def validate_config() -> tuple[str, ...]:
+    """
+    Validate the configuration and return the warnings/errors found.
     
-    if DATABASE_POOL_TIMEOUT < 5:
-        warnings.append(
-            "WARNING: DATABASE_POOL_TIMEOUT should be at least 5 seconds. "
-            f"Current value: {DATABASE_POOL_TIMEOUT}"
-        )
+    The settings are read once at import time, so the result is cached.
     
-    return warnings
+    Returns:
+        Tuple of configuration warnings or errors
+    """
+    return tuple(message for check, message in _VALIDATORS if check())
 
 def is_production() -> bool:
     """
@@ -129,9 +133,4 @@ def is_production() -> bool:
     Returns:
         True if production-like environment detected
     """
-    # Simple heuristic - can be enhanced based on your deployment setup
-    return (
-        os.getenv("NODE_ENV") == "production" or
-        os.getenv("ENVIRONMENT") == "production" or
-        os.getenv("FLASK_ENV") == "production"
-    )
+    return IS_PRODUCTION
@@ -5,22 +5,28 @@ Provides robust database connection management with pooling, health checks, and
 
 import os
 import time
+import random
 import asyncio
 import logging
-from typing import Optional, Dict, Any, List
+import weakref
+from typing import Optional, Dict, Any, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
-from urllib.parse import urlparse
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
 import psycopg2
 from psycopg2 import pool
 from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
 import threading
 from datetime import datetime, timedelta
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# No handlers here; records propagate to the root logger, which main.py sets up via
+# logger.setup_logging() when it is imported (monitor_database.py uses logging.basicConfig)
 logger = logging.getLogger(__name__)
 
+# Transient failures worth retrying; anything else (bad SQL, permissions, misconfiguration) is raised at once
+RETRYABLE_ERRORS = (psycopg2.OperationalError, psycopg2.InterfaceError, pool.PoolError)
+
 @dataclass
 class DatabaseConfig:
     """Database configuration parameters."""
@@ -34,10 +40,38 @@ class DatabaseConfig:
     retry_attempts: int = 3
     retry_delay: float = 2.0
     max_retry_delay: float = 60.0
+    validate_after_seconds: float = 30.0  # Re-probe connections idle for longer than this
+    statement_timeout_ms: int = 30000  # Server-side limit per statement
+    keepalives_idle: int = 30  # Seconds of idle before the first TCP keepalive probe
+    keepalives_interval: int = 10  # Seconds between unanswered keepalive probes
+    keepalives_count: int = 3  # Unanswered probes before the connection is considered dead
+    
+    # Components of connection_string, parsed once for logging and metrics
+    host: Optional[str] = field(init=False, default=None)
+    port: Optional[int] = field(init=False, default=None)
+    dbname: Optional[str] = field(init=False, default=None)
+    
+    # Exponential backoff schedule for connection retries, capped at max_retry_delay
+    retry_delays: Tuple[float, ...] = field(init=False, default=())
+    
+    def __post_init__(self):
+        # Key=value DSNs have no URL components; libpq still receives the raw string either way
+        parsed = urlsplit(self.connection_string)
+        self.host = parsed.hostname
+        try:
+            self.port = parsed.port
+        except ValueError:
+            self.port = None
+        self.dbname = parsed.path.lstrip('/') or None
+        
+        self.retry_delays = tuple(
+            min(self.retry_delay * (2 ** attempt), self.max_retry_delay)
+            for attempt in range(self.retry_attempts)
+        )
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ConnectionHealth:
-    """Database connection health status."""
+    """Database connection health status (an immutable snapshot)."""
     is_healthy: bool
     last_check: datetime
     response_time_ms: float
@@ -60,8 +94,8 @@ class DatabaseManager:
             active_connections=0,
             total_connections=0
         )
-        self._lock = threading.Lock()
-        self._health_check_task: Optional[asyncio.Task] = None
+        self._validated_at = weakref.WeakKeyDictionary()  # connection -> monotonic time of last probe
+        self._health_thread: Optional[threading.Thread] = None
         self._shutdown_event = threading.Event()
         
     def initialize(self) -> bool:
@@ -72,22 +106,28 @@ class DatabaseManager:
             bool: True if initialization successful, False otherwise
         """
         try:
-            logger.info("Initializing database connection pool...")
+            logger.info("Initializing database connection pool for %s:%s/%s...",
+                        self.config.host, self.config.port or 5432, self.config.dbname)
             
-            # Parse connection string to extract components
-            parsed_url = urlparse(self.config.connection_string)
-            
-            # Create connection pool
+            # Create connection pool; it starts empty and is filled concurrently below
             self.connection_pool = psycopg2.pool.ThreadedConnectionPool(
-                minconn=self.config.min_connections,
+                minconn=0,
                 maxconn=self.config.max_connections,
                 dsn=self.config.connection_string,
-                options=f"-c statement_timeout={self.config.pool_timeout * 1000}"
+                options=f"-c statement_timeout={self.config.statement_timeout_ms}",
+                # Let the kernel detect connections silently dropped by a load balancer or NAT
+                keepalives=1,
+                keepalives_idle=self.config.keepalives_idle,
+                keepalives_interval=self.config.keepalives_interval,
+                keepalives_count=self.config.keepalives_count
             )
+            self.connection_pool.minconn = self.config.min_connections
+            self._prefill_pool()
             
             # Test initial connection
             if self._test_connection():
-                logger.info(f"Database connection pool initialized successfully with {self.config.min_connections}-{self.config.max_connections} connections")
+                logger.info("Database connection pool initialized successfully with %d-%d connections",
+                            self.config.min_connections, self.config.max_connections)
                 self._start_health_monitoring()
                 return True
             else:
@@ -95,9 +135,39 @@ class DatabaseManager:
                 return False
                 
         except Exception as e:
-            logger.error(f"Failed to initialize database connection pool: {e}")
+            logger.error("Failed to initialize database connection pool: %s", e)
             return False
     
+    def _prefill_pool(self):
+        """
+        Open the pool's minimum connections in parallel.
+        
+        psycopg2 opens them one after another in the pool constructor, so each
+        connection's TCP/TLS handshake and authentication waits on the previous one.
+        """
+        count = self.config.min_connections
+        if count <= 0:
+            return
+        
+        with ThreadPoolExecutor(max_workers=count, thread_name_prefix="db-connect") as executor:
+            # _connect() without a key adds the new connection to the idle list
+            list(executor.map(lambda _: self.connection_pool._connect(), range(count)))
+    
+    def _pool_counts(self) -> tuple[int, int]:
+        """
+        Count the pool's checked-out and idle connections.
+        
+        Returns:
+            tuple[int, int]: (active, idle) connection counts
+        """
+        connection_pool = self.connection_pool
+        if not connection_pool or connection_pool.closed:
+            return 0, 0
+        
+        # psycopg2 keeps checked-out connections in _used and idle ones in _pool
+        with connection_pool._lock:
+            return len(connection_pool._used), len(connection_pool._pool)
+    
     def _test_connection(self) -> bool:
         """
         Test database connection and update health status.
@@ -105,7 +175,10 @@ class DatabaseManager:
         Returns:
             bool: True if connection is healthy, False otherwise
         """
-        start_time = time.time()
+        # One wall-clock read for the report; elapsed time uses the monotonic clock
+        last_check = datetime.now()
+        start_time = time.monotonic()
+        error_msg = None
         
         try:
             if not self.connection_pool:
@@ -115,128 +188,157 @@ class DatabaseManager:
             conn = self.connection_pool.getconn()
             if not conn:
                 return False
-                
+            
+            passed = False
             try:
                 # Test the connection with a simple query
                 with conn.cursor() as cursor:
                     cursor.execute("SELECT 1")
-                    result = cursor.fetchone()
-                    
-                # Update health status
-                response_time = (time.time() - start_time) * 1000
-                
-                with self._lock:
-                    self.health_status = ConnectionHealth(
-                        is_healthy=True,
-                        last_check=datetime.now(),
-                        response_time_ms=response_time,
-                        active_connections=self.connection_pool.closed,
-                        total_connections=self.connection_pool.maxconn,
-                        error_message=None
-                    )
-                
-                logger.debug(f"Database health check passed - response time: {response_time:.2f}ms")
-                return True
+                    cursor.fetchone()
+                passed = True
                 
             finally:
-                # Return connection to pool
-                self.connection_pool.putconn(conn)
+                # Return connection to pool, discarding it if the probe failed
+                self.connection_pool.putconn(conn, close=not passed)
                 
         except Exception as e:
             error_msg = f"Database health check failed: {e}"
             logger.warning(error_msg)
-            
-            with self._lock:
-                self.health_status = ConnectionHealth(
-                    is_healthy=False,
-                    last_check=datetime.now(),
-                    response_time_ms=(time.time() - start_time) * 1000,
-                    active_connections=self.connection_pool.closed if self.connection_pool else 0,
-                    total_connections=self.connection_pool.maxconn if self.connection_pool else 0,
-                    error_message=error_msg
-                )
-            
+        
+        # Update health status
+        response_time = (time.monotonic() - start_time) * 1000
+        active, idle = self._pool_counts()
+        
+        # Publish a new snapshot with a single attribute store; readers never see a partial update
+        self.health_status = ConnectionHealth(
+            is_healthy=error_msg is None,
+            last_check=last_check,
+            response_time_ms=response_time,
+            active_connections=active,
+            total_connections=active + idle,
+            error_message=error_msg
+        )
+        
+        if error_msg is not None:
             return False
+        
+        logger.debug("Database health check passed - response time: %.2fms", response_time)
+        return True
     
     def _start_health_monitoring(self):
         """Start background health monitoring task."""
         def health_monitor():
-            while not self._shutdown_event.is_set():
+            # Waiting on the shutdown event instead of sleeping lets close() stop the loop immediately
+            delay = self.config.health_check_interval
+            while not self._shutdown_event.wait(delay):
                 try:
                     self._test_connection()
-                    time.sleep(self.config.health_check_interval)
+                    delay = self.config.health_check_interval
                 except Exception as e:
-                    logger.error(f"Health monitoring error: {e}")
-                    time.sleep(5)  # Short delay before retrying
+                    logger.error("Health monitoring error: %s", e)
+                    delay = 5  # Short delay before retrying
         
-        health_thread = threading.Thread(target=health_monitor, daemon=True)
-        health_thread.start()
+        self._shutdown_event.clear()
+        self._health_thread = threading.Thread(target=health_monitor, name="db-health-monitor", daemon=True)
+        self._health_thread.start()
         logger.info("Database health monitoring started")
     
+    def _checkout_connection(self):
+        """
+        Check out a connection from the pool and verify it.
+        
+        This blocks on the network, so async callers run it in a worker thread.
+        
+        Returns:
+            psycopg2.connection: Verified database connection
+        """
+        connection = self.connection_pool.getconn()
+        if not connection:
+            raise RuntimeError("Failed to get connection from pool")
+        
+        # Only probe connections that have not been validated recently
+        now = time.monotonic()
+        last_validated = self._validated_at.get(connection)
+        if last_validated is None or now - last_validated > self.config.validate_after_seconds:
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+            except Exception:
+                # Discard the broken connection rather than returning it to the pool
+                self._validated_at.pop(connection, None)
+                self.connection_pool.putconn(connection, close=True)
+                raise
+            self._validated_at[connection] = now
+        
+        return connection
+    
     @asynccontextmanager
     async def get_connection(self):
         """
         Get a database connection from the pool with retry logic.
         
+        The connection is checked out in a worker thread so the event loop is
+        never blocked on the pool, and is returned to the pool on exit.
+        
         Yields:
             psycopg2.connection: Database connection
         """
+        if not self.connection_pool:
+            raise RuntimeError("Database connection pool not initialized")
+        
         connection = None
         last_exception = None
         
         for attempt in range(self.config.retry_attempts):
             try:
-                if not self.connection_pool:
-                    raise RuntimeError("Database connection pool not initialized")
-                
                 # Get connection from pool
-                connection = self.connection_pool.getconn()
-                if not connection:
-                    raise RuntimeError("Failed to get connection from pool")
-                
-                # Test connection before yielding
-                with connection.cursor() as cursor:
-                    cursor.execute("SELECT 1")
-                
-                logger.debug("Database connection acquired successfully")
-                yield connection
-                return
+                connection = await asyncio.to_thread(self._checkout_connection)
+                break
                 
-            except Exception as e:
+            except RETRYABLE_ERRORS as e:
                 last_exception = e
-                logger.warning(f"Database connection attempt {attempt + 1} failed: {e}")
-                
-                # Clean up failed connection
-                if connection:
-                    try:
-                        self.connection_pool.putconn(connection, close=True)
-                    except:
-                        pass
-                    connection = None
+                logger.warning("Database connection attempt %d failed: %s", attempt + 1, e)
                 
-                # Calculate retry delay with exponential backoff
+                # Exponential backoff with jitter so clients don't reconnect in lockstep
                 if attempt < self.config.retry_attempts - 1:
-                    delay = min(
-                        self.config.retry_delay * (2 ** attempt),
-                        self.config.max_retry_delay
-                    )
-                    logger.info(f"Retrying database connection in {delay:.1f} seconds...")
+                    delay = self.config.retry_delays[attempt] * (0.5 + random.random() * 0.5)
+                    logger.info("Retrying database connection in %.1f seconds...", delay)
                     await asyncio.sleep(delay)
+        else:
+            # All retry attempts failed
+            error_msg = f"Failed to get database connection after {self.config.retry_attempts} attempts: {last_exception}"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
         
-        # All retry attempts failed
-        error_msg = f"Failed to get database connection after {self.config.retry_attempts} attempts: {last_exception}"
-        logger.error(error_msg)
-        raise RuntimeError(error_msg)
+        logger.debug("Database connection acquired successfully")
+        connection_pool = self.connection_pool
+        discard = False
+        try:
+            yield connection
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            # The connection itself is likely broken; don't hand it out again
+            discard = True
+            raise
+        finally:
+            # Return connection to pool, unless the pool was closed meanwhile
+            if connection_pool and not connection_pool.closed:
+                if discard:
+                    self._validated_at.pop(connection, None)
+                else:
+                    # A connection that just served a workload is known to be good
+                    self._validated_at[connection] = time.monotonic()
+                connection_pool.putconn(connection, close=discard)
     
     def get_health_status(self) -> ConnectionHealth:
         """
         Get current database health status.
         
+        The status is replaced wholesale on every check, so reading it needs no lock.
+        
         Returns:
             ConnectionHealth: Current health status
         """
-        with self._lock:
-            return self.health_status
+        return self.health_status
     
     def get_pool_stats(self) -> Dict[str, Any]:
         """
@@ -248,20 +350,28 @@ class DatabaseManager:
         if not self.connection_pool:
             return {"error": "Connection pool not initialized"}
         
+        active, idle = self._pool_counts()
+        max_connections = self.connection_pool.maxconn
+        
         return {
             "min_connections": self.connection_pool.minconn,
-            "max_connections": self.connection_pool.maxconn,
-            "active_connections": self.connection_pool.closed,
-            "available_connections": self.connection_pool.maxconn - self.connection_pool.closed,
-            "pool_utilization": f"{(self.connection_pool.closed / self.connection_pool.maxconn) * 100:.1f}%"
+            "max_connections": max_connections,
+            "active_connections": active,
+            "idle_connections": idle,
+            "total_connections": active + idle,
+            "available_connections": max_connections - active,
+            "pool_utilization": f"{(active / max_connections) * 100:.1f}%"
         }
     
     def close(self):
         """Close the database connection pool and cleanup resources."""
         logger.info("Closing database connection pool...")
         
-        # Signal health monitoring to stop
+        # Signal health monitoring to stop and wait for any in-flight check to finish
         self._shutdown_event.set()
+        if self._health_thread and self._health_thread is not threading.current_thread():
+            self._health_thread.join(timeout=self.config.pool_timeout)
+            self._health_thread = None
         
         # Close connection pool
         if self.connection_pool:
@@ -269,7 +379,7 @@ class DatabaseManager:
                 self.connection_pool.closeall()
                 logger.info("Database connection pool closed successfully")
             except Exception as e:
-                logger.error(f"Error closing database connection pool: {e}")
+                logger.error("Error closing database connection pool: %s", e)
             finally:
                 self.connection_pool = None
 
@@ -294,11 +404,17 @@ def create_database_config() -> DatabaseConfig:
         health_check_interval=int(os.getenv('DATABASE_HEALTH_CHECK_INTERVAL', '60')),
         retry_attempts=int(os.getenv('DATABASE_RETRY_ATTEMPTS', '3')),
         retry_delay=float(os.getenv('DATABASE_RETRY_DELAY', '2.0')),
-        max_retry_delay=float(os.getenv('DATABASE_MAX_RETRY_DELAY', '60.0'))
+        max_retry_delay=float(os.getenv('DATABASE_MAX_RETRY_DELAY', '60.0')),
+        validate_after_seconds=float(os.getenv('DATABASE_VALIDATE_AFTER', '30.0')),
+        statement_timeout_ms=int(os.getenv('DATABASE_STATEMENT_TIMEOUT_MS', '30000')),
+        keepalives_idle=int(os.getenv('DATABASE_KEEPALIVES_IDLE', '30')),
+        keepalives_interval=int(os.getenv('DATABASE_KEEPALIVES_INTERVAL', '10')),
+        keepalives_count=int(os.getenv('DATABASE_KEEPALIVES_COUNT', '3'))
     )
 
 # Global database manager instance
 _db_manager: Optional[DatabaseManager] = None
+_db_manager_lock = threading.Lock()
 
 def get_database_manager() -> DatabaseManager:
     """
@@ -309,19 +425,30 @@ def get_database_manager() -> DatabaseManager:
     """
     global _db_manager
     
-    if _db_manager is None:
-        config = create_database_config()
-        _db_manager = DatabaseManager(config)
-        
-        if not _db_manager.initialize():
-            raise RuntimeError("Failed to initialize database manager")
+    # Fast path: no lock once the manager exists
+    db_manager = _db_manager
+    if db_manager is not None:
+        return db_manager
     
-    return _db_manager
+    with _db_manager_lock:
+        # Another thread may have finished initializing while we waited
+        if _db_manager is None:
+            config = create_database_config()
+            db_manager = DatabaseManager(config)
+            
+            if not db_manager.initialize():
+                raise RuntimeError("Failed to initialize database manager")
+            
+            # Publish only a fully initialized manager
+            _db_manager = db_manager
+        
+        return _db_manager
 
 def close_database_manager():
     """Close the global database manager."""
     global _db_manager
     
-    if _db_manager:
-        _db_manager.close()
-        _db_manager = None
+    with _db_manager_lock:
+        if _db_manager:
+            _db_manager.close()
+            _db_manager = None
@@ -2,18 +2,41 @@
 Health check endpoints and monitoring for mcp-mem0 server.
 """
 
-import asyncio
 import time
-from typing import Dict, Any, Optional
+import threading
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 import json
 
 from database_manager import get_database_manager, ConnectionHealth
 
-@dataclass
+try:
+    import psutil
+    # One handle for this process, reused by every memory probe
+    _PROCESS = psutil.Process()
+except ImportError:
+    # Fallback if psutil is not available
+    _PROCESS = None
+
+try:
+    import orjson
+    
+    def dumps_json(data: Any) -> str:
+        """Serialize to indented JSON using orjson's C encoder."""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str).decode()
+except ImportError:
+    # Fallback if orjson is not available
+    def dumps_json(data: Any) -> str:
+        """Serialize to indented JSON."""
+        return json.dumps(data, indent=2, default=str)
+
+# A failed database check older than this marks the service unhealthy rather than degraded
+STALE_CHECK_AGE = timedelta(minutes=5)
+
+@dataclass(frozen=True, slots=True)
 class ServiceHealth:
-    """Overall service health status."""
+    """Overall service health status (an immutable snapshot)."""
     status: str  # "healthy", "degraded", "unhealthy"
     timestamp: datetime
     uptime_seconds: float
@@ -25,23 +48,24 @@ class HealthChecker:
     """Service health monitoring and reporting."""
     
     def __init__(self):
-        self.start_time = time.time()
-        self._last_health_check = None
+        self.start_time = time.monotonic()
+        # (time.monotonic() of the refresh, ServiceHealth) published as one tuple so reads are lock-free
+        self._last_health_check: Optional[Tuple[float, ServiceHealth]] = None
         self._health_cache_duration = 30  # Cache health status for 30 seconds
+        # (ServiceHealth, rendered JSON) for the load balancer endpoint
+        self._health_payload: Optional[Tuple[ServiceHealth, str]] = None
+        # ((ServiceHealth, pool stats), rendered JSON) for the detailed endpoint
+        self._detailed_payload: Optional[Tuple[tuple, str]] = None
     
     def get_uptime(self) -> float:
         """Get service uptime in seconds."""
-        return time.time() - self.start_time
+        return time.monotonic() - self.start_time
     
     def get_memory_usage(self) -> float:
         """Get current memory usage in MB."""
-        try:
-            import psutil
-            process = psutil.Process()
-            return process.memory_info().rss / 1024 / 1024
-        except ImportError:
-            # Fallback if psutil is not available
+        if _PROCESS is None:
             return 0.0
+        return _PROCESS.memory_info().rss / (1024 * 1024)
     
     async def get_health_status(self, force_refresh: bool = False) -> ServiceHealth:
         """
@@ -53,11 +77,31 @@ class HealthChecker:
         Returns:
             ServiceHealth: Current service health status
         """
+        return self._get_health(force_refresh)
+    
+    def _get_health(self, force_refresh: bool = False) -> ServiceHealth:
+        """Return the cached health snapshot, refreshing it if stale or forced."""
         # Use cached data if available and not forcing refresh
+        cached = self._last_health_check
         if (not force_refresh and 
-            self._last_health_check and 
-            (datetime.now() - self._last_health_check).seconds < self._health_cache_duration):
-            return self._last_health_check
+            cached is not None and 
+            time.monotonic() - cached[0] < self._health_cache_duration):
+            return cached[1]
+        
+        return self._refresh_health()
+    
+    def _refresh_health(self) -> ServiceHealth:
+        """
+        Build a fresh service health snapshot and cache it.
+        
+        This only reads the database manager's latest check result and never awaits,
+        so it can be called from both sync and async code.
+        
+        Returns:
+            ServiceHealth: Current service health status
+        """
+        # Wall-clock time is only needed for the reported timestamps; take it once
+        now = datetime.now()
         
         try:
             # Get database health
@@ -67,31 +111,31 @@ class HealthChecker:
             # Determine overall status
             if db_health.is_healthy:
                 status = "healthy"
-            elif db_health.last_check > datetime.now() - timedelta(minutes=5):
+            elif db_health.last_check > now - STALE_CHECK_AGE:
                 status = "degraded"  # Recent check but unhealthy
             else:
                 status = "unhealthy"  # No recent successful check
             
             health = ServiceHealth(
                 status=status,
-                timestamp=datetime.now(),
+                timestamp=now,
                 uptime_seconds=self.get_uptime(),
                 database=db_health,
                 memory_usage_mb=self.get_memory_usage()
             )
             
-            self._last_health_check = health
+            self._last_health_check = (time.monotonic(), health)
             return health
             
         except Exception as e:
             # If we can't get health status, return unhealthy
             return ServiceHealth(
                 status="unhealthy",
-                timestamp=datetime.now(),
+                timestamp=now,
                 uptime_seconds=self.get_uptime(),
                 database=ConnectionHealth(
                     is_healthy=False,
-                    last_check=datetime.now(),
+                    last_check=now,
                     response_time_ms=0.0,
                     active_connections=0,
                     total_connections=0,
@@ -100,6 +144,28 @@ class HealthChecker:
                 memory_usage_mb=self.get_memory_usage()
             )
     
+    def render_health(self, health: ServiceHealth) -> str:
+        """
+        Render the load balancer health payload, reusing it while the snapshot is unchanged.
+        
+        Args:
+            health: Health snapshot to render
+            
+        Returns:
+            str: JSON health summary
+        """
+        cached = self._health_payload
+        if cached is not None and cached[0] is health:
+            return cached[1]
+        
+        payload = dumps_json({
+            "status": health.status,
+            "timestamp": health.timestamp.isoformat(),
+            "uptime_seconds": health.uptime_seconds
+        })
+        self._health_payload = (health, payload)
+        return payload
+    
     def get_detailed_status(self) -> Dict[str, Any]:
         """
         Get detailed service status including database pool statistics.
@@ -109,50 +175,94 @@ class HealthChecker:
         """
         try:
             db_manager = get_database_manager()
-            health = asyncio.run(self.get_health_status(force_refresh=True))
+            health = self._refresh_health()
             pool_stats = db_manager.get_pool_stats()
             
-            return {
-                "service": {
-                    "status": health.status,
-                    "uptime_seconds": health.uptime_seconds,
-                    "uptime_human": str(timedelta(seconds=int(health.uptime_seconds))),
-                    "memory_usage_mb": health.memory_usage_mb,
-                    "version": health.version,
-                    "timestamp": health.timestamp.isoformat()
-                },
-                "database": {
-                    "is_healthy": health.database.is_healthy,
-                    "last_check": health.database.last_check.isoformat(),
-                    "response_time_ms": health.database.response_time_ms,
-                    "active_connections": health.database.active_connections,
-                    "total_connections": health.database.total_connections,
-                    "error_message": health.database.error_message,
-                    "pool_stats": pool_stats
-                }
-            }
+            return self._build_detailed_status(health, pool_stats)
+        except Exception as e:
+            return self._error_status(e)
+    
+    def get_detailed_payload(self) -> str:
+        """
+        Render the detailed status as JSON from the cached health snapshot.
+        
+        The rendered payload is reused until the snapshot is refreshed or the
+        pool statistics change.
+        
+        Returns:
+            str: JSON detailed service status
+        """
+        try:
+            db_manager = get_database_manager()
+            health = self._get_health()
+            pool_stats = db_manager.get_pool_stats()
         except Exception as e:
-            return {
-                "service": {
-                    "status": "unhealthy",
-                    "error": str(e),
-                    "timestamp": datetime.now().isoformat()
-                },
-                "database": {
-                    "is_healthy": False,
-                    "error": str(e)
-                }
+            return dumps_json(self._error_status(e))
+        
+        key = (health, tuple(pool_stats.items()))
+        cached = self._detailed_payload
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        payload = dumps_json(self._build_detailed_status(health, pool_stats))
+        self._detailed_payload = (key, payload)
+        return payload
+    
+    @staticmethod
+    def _build_detailed_status(health: ServiceHealth, pool_stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Assemble the detailed status dictionary from a health snapshot and pool statistics."""
+        return {
+            "service": {
+                "status": health.status,
+                "uptime_seconds": health.uptime_seconds,
+                "uptime_human": str(timedelta(seconds=int(health.uptime_seconds))),
+                "memory_usage_mb": health.memory_usage_mb,
+                "version": health.version,
+                "timestamp": health.timestamp.isoformat()
+            },
+            "database": {
+                "is_healthy": health.database.is_healthy,
+                "last_check": health.database.last_check.isoformat(),
+                "response_time_ms": health.database.response_time_ms,
+                "active_connections": health.database.active_connections,
+                "total_connections": health.database.total_connections,
+                "error_message": health.database.error_message,
+                "pool_stats": pool_stats
             }
+        }
+    
+    @staticmethod
+    def _error_status(error: Exception) -> Dict[str, Any]:
+        """Detailed status reported when health information cannot be collected."""
+        return {
+            "service": {
+                "status": "unhealthy",
+                "error": str(error),
+                "timestamp": datetime.now().isoformat()
+            },
+            "database": {
+                "is_healthy": False,
+                "error": str(error)
+            }
+        }
 
 # Global health checker instance
 _health_checker: Optional[HealthChecker] = None
+_health_checker_lock = threading.Lock()
 
 def get_health_checker() -> HealthChecker:
     """Get the global health checker instance."""
     global _health_checker
-    if _health_checker is None:
-        _health_checker = HealthChecker()
-    return _health_checker
+    
+    # Fast path: no lock once the checker exists
+    health_checker = _health_checker
+    if health_checker is not None:
+        return health_checker
+    
+    with _health_checker_lock:
+        if _health_checker is None:
+            _health_checker = HealthChecker()
+        return _health_checker
 
 async def health_check_endpoint() -> str:
     """
@@ -165,11 +275,7 @@ async def health_check_endpoint() -> str:
     health = await health_checker.get_health_status()
     
     # Return simple status for load balancers
-    return json.dumps({
-        "status": health.status,
-        "timestamp": health.timestamp.isoformat(),
-        "uptime_seconds": health.uptime_seconds
-    }, indent=2)
+    return health_checker.render_health(health)
 
 async def detailed_health_endpoint() -> str:
     """
@@ -179,6 +285,4 @@ async def detailed_health_endpoint() -> str:
         str: JSON response with detailed health information
     """
     health_checker = get_health_checker()
-    detailed_status = health_checker.get_detailed_status()
-    
-    return json.dumps(detailed_status, indent=2, default=str)
+    return health_checker.get_detailed_payload()
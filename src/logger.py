@@ -3,10 +3,20 @@ Logging configuration for mcp-mem0 server.
 Respects DEBUG and LOG_LEVEL environment variables.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+from typing import Optional
 from config import DEBUG, LOG_LEVEL
 
+# Looked up once; getLogger() takes the logging module's lock on every call
+_logger = logging.getLogger('mcp-mem0')
+
+# Background thread that writes queued log records to stderr
+_listener: Optional[logging.handlers.QueueListener] = None
+
 def setup_logging():
     """Setup logging configuration based on environment variables."""
     
@@ -21,40 +31,46 @@ def setup_logging():
         # Production format - cleaner
         log_format = '%(asctime)s - %(levelname)s - %(message)s'
     
-    # Configure root logger
-    logging.basicConfig(
-        level=log_level,
-        format=log_format,
-        handlers=[
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    # Configure root logger (like basicConfig, leave existing handlers alone)
+    global _listener
+    root = logging.getLogger()
+    if not root.handlers:
+        # Callers only enqueue records; a listener thread does the formatting and blocking writes.
+        # stderr, because with TRANSPORT=stdio stdout carries the MCP protocol itself
+        stream_handler = logging.StreamHandler(sys.stderr)
+        stream_handler.setFormatter(logging.Formatter(log_format))
+        
+        log_queue = queue.SimpleQueue()
+        _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_listener.stop)  # Flush records still in the queue on exit
+        
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
+        root.setLevel(log_level)
     
     # Set specific logger levels
+    # DEBUG=true turns on debug_log() output even when LOG_LEVEL leaves other loggers at INFO
+    _logger.setLevel(logging.DEBUG if DEBUG else log_level)
     logging.getLogger('httpx').setLevel(logging.WARNING)
     logging.getLogger('urllib3').setLevel(logging.WARNING)
     logging.getLogger('mem0').setLevel(logging.INFO)
     logging.getLogger('database_manager').setLevel(logging.INFO)
     
-    return logging.getLogger('mcp-mem0')
+    return _logger
 
-def debug_log(message: str):
-    """Log debug message only if DEBUG is enabled."""
+def debug_log(message: str, *args, exc_info: bool = False):
+    """Log debug message only if DEBUG is enabled (with the current traceback if exc_info is set)."""
     if DEBUG:
-        logger = logging.getLogger('mcp-mem0')
-        logger.debug(message)
+        _logger.debug(message, *args, exc_info=exc_info, stacklevel=2)
 
-def info_log(message: str):
+def info_log(message: str, *args):
     """Log info message."""
-    logger = logging.getLogger('mcp-mem0')
-    logger.info(message)
+    _logger.info(message, *args, stacklevel=2)
 
-def warning_log(message: str):
+def warning_log(message: str, *args):
     """Log warning message."""
-    logger = logging.getLogger('mcp-mem0')
-    logger.warning(message)
+    _logger.warning(message, *args, stacklevel=2)
 
-def error_log(message: str):
+def error_log(message: str, *args):
     """Log error message."""
-    logger = logging.getLogger('mcp-mem0')
-    logger.error(message)
+    _logger.error(message, *args, stacklevel=2)
@@ -1,31 +1,74 @@
 # Load environment variables first, before any other imports
 import os
-from dotenv import load_dotenv
-# Only load .env if environment variables aren't already set
-if not os.getenv('DATABASE_URL'):
-    load_dotenv()
+# Only load .env if environment variables aren't already set and this isn't a
+# container/systemd deployment (ENV=prod) that passes its settings directly
+if not os.getenv('DATABASE_URL') and os.getenv('SKIP_DOTENV') != '1' and os.getenv('ENV') != 'prod':
+    try:
+        # Prefer the snapshot written by compile_env.py while it matches .env
+        import _env_compiled
+        if os.stat(_env_compiled.SOURCE_PATH).st_mtime_ns != _env_compiled.SOURCE_MTIME_NS:
+            raise ImportError("compiled .env is stale")
+        for key, value in _env_compiled.VALUES.items():
+            os.environ.setdefault(key, value)
+    except (ImportError, OSError):
+        # Only import dotenv if there is a .env for it to find (it searches this directory and its parents)
+        from pathlib import Path
+        if any((directory / '.env').is_file() for directory in Path(__file__).resolve().parents):
+            from dotenv import load_dotenv
+            load_dotenv()
 
 from mcp.server.fastmcp import FastMCP, Context
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from collections.abc import AsyncIterator
 from dataclasses import dataclass
+from operator import itemgetter
 from mem0 import Memory
 import asyncio
+import functools
 import json
-from typing import Optional, Dict, Any
+import random
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Callable, Union, Annotated
+from pydantic import Field
 
 from utils import get_mem0_client
+from response_cache import ResponseCache
+from semantic_cache import SemanticCache
+from logger import debug_log, setup_logging
 from config import (
     DEFAULT_USER_ID, 
     HOST, 
     PORT, 
     TRANSPORT,
     MCP_TIMEOUT,
+    MEM0_CONCURRENCY,
+    IS_PRODUCTION,
+    RESPONSE_CACHE_MAX_ENTRIES,
+    SEARCH_CACHE_TTL,
+    GET_ALL_CACHE_TTL,
+    GET_ALL_MAX_MEMORIES,
+    SEMANTIC_CACHE_THRESHOLD,
     validate_config
 )
 
+# Tool responses are read by MCP clients, not people, so they are compact by default
+try:
+    import orjson
+    
+    def dumps_json(data: Any, pretty: bool = False) -> str:
+        """Serialize to JSON using orjson's C encoder, indented only when pretty is set."""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None).decode()
+except ImportError:
+    # Fallback if orjson is not available
+    def dumps_json(data: Any, pretty: bool = False) -> str:
+        """Serialize to JSON, indented only when pretty is set."""
+        if pretty:
+            return json.dumps(data, indent=2)
+        return json.dumps(data, separators=(",", ":"))
+
 # Create a dataclass for our application context
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Mem0Context:
     """Context for the Mem0 MCP server."""
     mem0_client: Memory
@@ -33,6 +76,95 @@ class Mem0Context:
 # Global client cache to prevent recreation
 _cached_mem0_client = None
 
+# Rendered search responses and each user's flattened memory list (pages are sliced from it),
+# dropped per user whenever their memories change
+_search_cache = ResponseCache(maxsize=RESPONSE_CACHE_MAX_ENTRIES, ttl=SEARCH_CACHE_TTL)
+_all_cache = ResponseCache(maxsize=RESPONSE_CACHE_MAX_ENTRIES, ttl=GET_ALL_CACHE_TTL)
+
+# Searches currently running, by response cache key, so identical concurrent searches can share them
+_inflight_searches: Dict[tuple, asyncio.Future] = {}
+
+# Search results reused for near-duplicate queries (opt-in via SEMANTIC_CACHE_THRESHOLD)
+_semantic_cache = SemanticCache(threshold=SEMANTIC_CACHE_THRESHOLD, ttl=SEARCH_CACHE_TTL)
+
+def _invalidate_user_caches(user_id: str):
+    """Drop every cached response for a user after their memories change."""
+    _search_cache.invalidate_user(user_id)
+    _all_cache.invalidate_user(user_id)
+    _semantic_cache.invalidate_user(user_id)
+
+def _render_search(userId: str, query: str, flattened_memories: list) -> str:
+    """Build the search_memories response for a list of results."""
+    return dumps_json({
+        "user_id": userId,
+        "query": query,
+        "results": flattened_memories,
+        "count": len(flattened_memories)
+    })
+
+# Blocking Mem0 calls run on their own worker threads, one per permitted concurrent call.
+# The semaphore makes bursts of tool calls queue here, where a timed-out call can still be
+# cancelled, instead of exhausting the threads and the database connection pool
+_mem0_executor = ThreadPoolExecutor(max_workers=MEM0_CONCURRENCY, thread_name_prefix="mem0")
+_mem0_semaphore = asyncio.Semaphore(MEM0_CONCURRENCY)
+
+async def _run_mem0(func, *args, **kwargs):
+    """Run a blocking Mem0 client call on the Mem0 worker threads, within the concurrency limit."""
+    async with _mem0_semaphore:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_mem0_executor, functools.partial(func, *args, **kwargs))
+
+# Pulls the memory text out of each Mem0 result; map() calls it without per-item bytecode
+_get_memory = itemgetter("memory")
+
+def _flatten_memories(memories: Any) -> list:
+    """
+    Normalize a Mem0 response to a list: the memory texts of a {"results": [...]} dict, or the items of a list.
+    
+    Raises:
+        ValueError: If Mem0 returned an error message instead of results; @memory_tool reports
+            it with the tool's usual error prefix
+    """
+    if isinstance(memories, str):
+        raise ValueError(memories)
+    if isinstance(memories, dict):
+        return list(map(_get_memory, memories.get("results") or ()))
+    return memories if isinstance(memories, list) else list(memories)
+
+# Static tool error responses, built once instead of on every failing call
+_ERR_EMPTY_USER = "Error: userId is required and cannot be empty"
+_ERR_EMPTY_CONTENT = "Error: content cannot be empty"
+_ERR_EMPTY_ITEMS = "Error: items must contain at least one non-empty string"
+_ERR_EMPTY_MEMORY_ID = "Error: memoryId is required and cannot be empty"
+_ERR_INVALID_PAGE = "Error: offset must be >= 0 and limit must be >= 1"
+_ERR_CLIENT_NOT_INITIALIZED = "Error: Mem0 client is not properly initialized"
+_ERR_SAVE_TIMED_OUT = f"Error: Memory save operation timed out after {MCP_TIMEOUT - 30} seconds. Content may be too long or complex."
+_ERR_OPERATION_TIMED_OUT = "Error: Operation timed out. The content may be too long or complex. Please try with shorter content or contact support if the issue persists."
+
+# Tool arguments that must contain a non-whitespace character. FastMCP validates these
+# before the tool runs and advertises the constraint in the tool's input schema
+NonBlankStr = Annotated[str, Field(min_length=1, pattern=r"\S")]
+
+def _validate_user(userId: str) -> Optional[str]:
+    """Return the error response for a missing or blank userId, or None if it is valid."""
+    if not userId or userId.isspace():
+        return _ERR_EMPTY_USER
+    return None
+
+# Set by mem0_lifespan; request handlers run in tasks started inside the lifespan, so they inherit it
+_mem0_client_var: ContextVar[Memory] = ContextVar("mem0_client")
+
+def _get_mem0_client(ctx: Context) -> Memory:
+    """Return the Mem0 client for a request without walking the lifespan context chain when possible."""
+    mem0_client = _mem0_client_var.get(None)
+    if mem0_client is None:
+        mem0_client = ctx.request_context.lifespan_context.mem0_client
+    return mem0_client
+
+# Install the log handlers before the client below is created, so its debug_log output
+# (and every tool's after it) is actually written
+setup_logging()
+
 # Initialize client at module load time to avoid timing issues
 print("DEBUG: Pre-initializing Mem0 client at module load...")
 try:
@@ -54,6 +186,7 @@ async def initialize_mem0_client():
     mem0_client = None
     max_retries = 5
     base_retry_delay = 2.0
+    max_retry_delay = 30.0
     
     for attempt in range(max_retries):
         try:
@@ -63,35 +196,26 @@ async def initialize_mem0_client():
             mem0_client = get_mem0_client()
             print(f"DEBUG: Mem0 client initialized successfully: {type(mem0_client)}")
             
-            # Test basic connectivity by attempting a simple operation
-            print("DEBUG: Testing Mem0 client connectivity...")
-            try:
-                # Try to get a small sample to verify connection works
-                test_result = mem0_client.get_all(user_id="test_connection", limit=1)
-                print("DEBUG: Mem0 client connectivity test passed")
-            except Exception as test_error:
-                print(f"DEBUG: Connectivity test failed: {test_error}")
-                # If it's a database error, we'll retry; otherwise, fail fast
-                if "database" not in str(test_error).lower() and "connection" not in str(test_error).lower():
-                    raise test_error
-            
-            # If we get here, the client is working
+            # No connectivity probe here: it cost a database and embedding round trip on
+            # every start, and the first real tool call surfaces connection errors anyway
             break
             
+        except (KeyError, ValueError) as e:
+            # Missing or invalid settings won't fix themselves between attempts
+            print(f"ERROR: Invalid Mem0 configuration: {e}")
+            print("Please check your configuration (see env.example for all required variables)")
+            raise RuntimeError(f"Failed to initialize Mem0 client: {e}") from e
+            
         except Exception as e:
             error_msg = f"Failed to initialize Mem0 client (attempt {attempt + 1}/{max_retries}): {str(e)}"
             print(f"ERROR: {error_msg}")
             
-            # Clean up failed client
-            if mem0_client:
-                try:
-                    del mem0_client
-                    mem0_client = None
-                except:
-                    pass
+            # Drop the failed client; refcounting frees it, no explicit collection needed
+            mem0_client = None
             
             if attempt < max_retries - 1:
-                retry_delay = base_retry_delay * (2 ** attempt)  # Exponential backoff
+                # Capped exponential backoff with jitter so restarting replicas don't retry in lockstep
+                retry_delay = min(max_retry_delay, base_retry_delay * (2 ** attempt)) * random.uniform(0.5, 1.5)
                 print(f"Retrying in {retry_delay:.1f} seconds...")
                 
                 # Provide specific guidance based on error type
@@ -153,6 +277,7 @@ async def mem0_lifespan(server: FastMCP) -> AsyncIterator[Mem0Context]:
         _cached_mem0_client = await initialize_mem0_client()
     
     # Yield the client immediately - no async operations in yield
+    _mem0_client_var.set(_cached_mem0_client)
     yield Mem0Context(mem0_client=_cached_mem0_client)
 
 # Initialize FastMCP server with the Mem0 client as context
@@ -164,11 +289,59 @@ mcp = FastMCP(
     timeout=MCP_TIMEOUT
 )        
 
-@mcp.tool()
+def _format_save_error(error: Exception) -> str:
+    """Turn an unexpected save_memory failure into its tool response."""
+    error_msg = str(error)
+    if "timeout" in error_msg.lower():
+        return _ERR_OPERATION_TIMED_OUT
+    return f"Error saving memory: {error_msg}"
+
+def _format_add_error(mem0_error: Exception) -> str:
+    """Turn a failed Mem0 add() call into its tool response."""
+    error_msg = str(mem0_error)
+    if "timeout" in error_msg.lower():
+        return f"Error: Memory save operation timed out. The content may be too long or the server is overloaded. Original error: {error_msg}"
+    elif "database" in error_msg.lower() or "connection" in error_msg.lower():
+        return f"Error: Database connection issue while saving memory. Please try again. Original error: {error_msg}"
+    else:
+        return f"Error calling Mem0 add: {error_msg}"
+
+def memory_tool(on_error: Union[str, Callable[[Exception], str]]):
+    """
+    Register a memory tool with the userId check and error handling every tool shares.
+    
+    The tool body only runs for a non-blank userId, and any exception it raises is returned
+    to the client as an error string instead of propagating.
+    
+    Args:
+        on_error: Prefix for the error response, or a function that builds it from the exception
+    """
+    format_error = on_error if callable(on_error) else lambda e: f"{on_error}: {str(e)}"
+    
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            # FastMCP passes tool arguments by keyword
+            error = _validate_user(kwargs.get("userId"))
+            if error:
+                return error
+            
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                # The traceback is only formatted if debug output is on
+                debug_log("Full error traceback for %s:", func.__name__, exc_info=True)
+                return format_error(e)
+        
+        return mcp.tool()(wrapper)
+    
+    return decorator
+
+@memory_tool(_format_save_error)
 async def save_memory(
     ctx: Context, 
-    content: str, 
-    userId: str
+    content: NonBlankStr, 
+    userId: NonBlankStr
 ) -> str:
     """Save information to your long-term memory with user isolation.
 
@@ -181,139 +354,174 @@ async def save_memory(
         content: The content to store in memory, including any relevant details and context
         userId: Required user identifier for memory isolation (must be provided)
     """
+    if not content or content.isspace():
+        return _ERR_EMPTY_CONTENT
+    
+    mem0_client = _get_mem0_client(ctx)
+    
+    # Log content length for debugging
+    content_length = len(content)
+    debug_log("Attempting to save memory for user: %s (%d characters)", userId, content_length)
+    
+    # Add memory with proper isolation and timeout handling
+    # Note: Mem0's add() method only supports user_id and metadata
     try:
-        # Validate required parameters
-        if not userId or userId.strip() == "":
-            return "Error: userId is required and cannot be empty"
-        
-        if not content or content.strip() == "":
-            return "Error: content cannot be empty"
-        
-        mem0_client = ctx.request_context.lifespan_context.mem0_client
-        
-        # Log content length for debugging
-        content_length = len(content)
-        print(f"DEBUG: Attempting to save memory for user: {userId}")
-        print(f"DEBUG: Content length: {content_length} characters")
-        print(f"DEBUG: Memory content preview: {content[:100]}...")
-        
-        # For very long content, we might want to chunk it or provide progress updates
-        if content_length > 1000:
-            print(f"DEBUG: Processing long content ({content_length} chars), this may take a moment...")
-        
-        # Prepare the memory payload
-        messages = [{"role": "user", "content": content}]
-        
-        # Add memory with proper isolation and timeout handling
-        # Note: Mem0's add() method only supports user_id and metadata
-        try:
-            # Use asyncio.wait_for to add our own timeout as a safety net
-            # This is in addition to the MCP server timeout
-            result = await asyncio.wait_for(
-                asyncio.to_thread(
-                    mem0_client.add,
-                    messages, 
-                    user_id=userId,
-                    metadata=None
-                ),
-                timeout=MCP_TIMEOUT - 30  # Leave 30 seconds buffer for MCP overhead
-            )
-            print(f"DEBUG: Memory saved successfully")
-        except asyncio.TimeoutError:
-            return f"Error: Memory save operation timed out after {MCP_TIMEOUT - 30} seconds. Content may be too long or complex."
-        except Exception as mem0_error:
-            error_msg = str(mem0_error)
-            if "timeout" in error_msg.lower():
-                return f"Error: Memory save operation timed out. The content may be too long or the server is overloaded. Original error: {error_msg}"
-            elif "database" in error_msg.lower() or "connection" in error_msg.lower():
-                return f"Error: Database connection issue while saving memory. Please try again. Original error: {error_msg}"
-            else:
-                return f"Error calling Mem0 add: {error_msg}"
-        
-        # Log the operation for security monitoring
-        preview = content[:100] + "..." if len(content) > 100 else content
-        return f"Successfully saved memory for user '{userId}' ({content_length} chars): {preview}"
-    
-    except Exception as e:
-        error_msg = str(e)
-        if "timeout" in error_msg.lower():
-            return f"Error: Operation timed out. The content may be too long or complex. Please try with shorter content or contact support if the issue persists."
-        else:
-            return f"Error saving memory: {error_msg}"
+        # Use asyncio.wait_for to add our own timeout as a safety net
+        # This is in addition to the MCP server timeout
+        result = await asyncio.wait_for(
+            _run_mem0(
+                mem0_client.add,
+                content,  # add() wraps a plain string as a single user message itself
+                user_id=userId,
+                metadata=None
+            ),
+            timeout=MCP_TIMEOUT - 30  # Leave 30 seconds buffer for MCP overhead
+        )
+        debug_log("Memory saved successfully")
+    except asyncio.TimeoutError:
+        return _ERR_SAVE_TIMED_OUT
+    except Exception as mem0_error:
+        return _format_add_error(mem0_error)
+    
+    # Cached responses for this user no longer reflect their memories
+    _invalidate_user_caches(userId)
+    
+    # Log the operation for security monitoring
+    preview = content if content_length <= 100 else content[:100] + "..."
+    return f"Successfully saved memory for user '{userId}' ({content_length} chars): {preview}"
+
+@memory_tool(_format_save_error)
+async def save_memories(
+    ctx: Context,
+    items: list[str],
+    userId: NonBlankStr
+) -> str:
+    """Save several pieces of information to long-term memory in one call, with user isolation.
 
-@mcp.tool()
+    Prefer this over repeated save_memory calls when storing more than one item: the items are
+    sent to Mem0 together, so they share one extraction and storage round trip.
+    Memories are isolated by userId to prevent cross-user data leakage.
+
+    Args:
+        ctx: The MCP server provided context which includes the Mem0 client
+        items: The contents to store in memory; empty entries are skipped
+        userId: Required user identifier for memory isolation (must be provided)
+    """
+    messages = [{"role": "user", "content": item} for item in items if item and not item.isspace()]
+    if not messages:
+        return _ERR_EMPTY_ITEMS
+    
+    mem0_client = _get_mem0_client(ctx)
+    
+    total_length = sum(len(message["content"]) for message in messages)
+    debug_log("Attempting to save %d memories for user: %s (%d characters)", len(messages), userId, total_length)
+    
+    # One add() call for the whole batch, with the same safety-net timeout as save_memory
+    try:
+        await asyncio.wait_for(
+            _run_mem0(
+                mem0_client.add,
+                messages,
+                user_id=userId,
+                metadata=None
+            ),
+            timeout=MCP_TIMEOUT - 30  # Leave 30 seconds buffer for MCP overhead
+        )
+        debug_log("Memories saved successfully")
+    except asyncio.TimeoutError:
+        return _ERR_SAVE_TIMED_OUT
+    except Exception as mem0_error:
+        return _format_add_error(mem0_error)
+    
+    # Cached responses for this user no longer reflect their memories
+    _invalidate_user_caches(userId)
+    
+    return f"Successfully saved {len(messages)} memories for user '{userId}' ({total_length} chars)"
+
+@memory_tool("Error retrieving memories")
 async def get_all_memories(
     ctx: Context,
-    userId: str
+    userId: NonBlankStr,
+    offset: int = 0,
+    limit: Optional[int] = None
 ) -> str:
     """Get all stored memories for a specific user.
     
     Call this tool when you need complete context of all previously stored memories for a user.
     Results are isolated by userId to ensure data privacy.
+    For users with many memories, pass a limit and follow next_offset to fetch them page by page.
 
     Args:
         ctx: The MCP server provided context which includes the Mem0 client
         userId: Required user identifier for memory isolation (must be provided)
+        offset: Index of the first memory to return (default 0)
+        limit: Maximum number of memories to return (default: all remaining)
+
+    Returns a JSON formatted list of the stored memories for the specified user, with the
+    total number of memories and the next_offset to request (null once everything is returned).
+    At most GET_ALL_MAX_MEMORIES memories are read; if the user has more, truncated is true
+    and total is null.
+    """
+    if offset < 0 or (limit is not None and limit < 1):
+        return _ERR_INVALID_PAGE
+    
+    # The user's list is fetched once and every page is sliced from it until their memories change
+    cache_key = _all_cache.make_key(userId, None)
+    cached = _all_cache.get(cache_key)
+    if cached is None:
+        cached = await _fetch_all_memories(_get_mem0_client(ctx), userId)
+        if isinstance(cached, str):
+            return cached
+        _all_cache.set(cache_key, cached)
+    all_memories, truncated = cached
+    
+    # Return the requested page of the user's memories (no filtering needed)
+    fetched = len(all_memories)
+    end = fetched if limit is None else min(offset + limit, fetched)
+    page = all_memories[offset:end] if offset or end < fetched else all_memories
+    
+    return dumps_json({
+        "user_id": userId,
+        "memories": page,
+        "count": len(page),
+        "total": None if truncated else fetched,
+        "offset": offset,
+        "next_offset": end if end < fetched else None,
+        "truncated": truncated
+    })
 
-    Returns a JSON formatted list of all stored memories for the specified user.
+async def _fetch_all_memories(mem0_client: Memory, userId: str):
+    """
+    Read and flatten a user's memories, up to GET_ALL_MAX_MEMORIES.
+    
+    Returns:
+        Tuple of (memory list, whether the user has more than were read), or an error response
     """
+    # Debug: Check if mem0_client is properly initialized
+    if mem0_client is None:
+        return _ERR_CLIENT_NOT_INITIALIZED
+    
+    # Debug: Log what we're about to do
+    debug_log("Attempting to get memories for user: %s", userId)
+    
+    # Get memories with proper isolation. Mem0 caps get_all() at 100 results unless told
+    # otherwise; ask for one more than the maximum to tell a complete list from a cut-off one
     try:
-        # Validate required parameters
-        if not userId or userId.strip() == "":
-            return "Error: userId is required and cannot be empty"
-        
-        mem0_client = ctx.request_context.lifespan_context.mem0_client
-        
-        # Debug: Check if mem0_client is properly initialized
-        if mem0_client is None:
-            return "Error: Mem0 client is not properly initialized"
-        
-        # Debug: Log what we're about to do
-        print(f"DEBUG: Attempting to get memories for user: {userId}")
-        
-        # Get memories with proper isolation
-        # Note: Mem0's get_all() method only supports user_id parameter
-        try:
-            memories = mem0_client.get_all(user_id=userId)
-            print(f"DEBUG: Mem0 client returned: {type(memories)} - {memories}")
-        except Exception as mem0_error:
-            return f"Error calling Mem0 get_all: {str(mem0_error)}"
-        
-        # Check if memories is a string (error message) or object
-        if isinstance(memories, str):
-            return f"Error retrieving memories: {memories}"
-        
-        # Debug: Check the structure of what we received
-        print(f"DEBUG: Memories type: {type(memories)}")
-        print(f"DEBUG: Memories content: {memories}")
-        
-        if isinstance(memories, dict) and "results" in memories:
-            flattened_memories = [memory["memory"] for memory in memories["results"]]
-        else:
-            flattened_memories = memories
-        
-        # Debug: Check flattened memories
-        print(f"DEBUG: Flattened memories type: {type(flattened_memories)}")
-        print(f"DEBUG: Flattened memories length: {len(flattened_memories) if hasattr(flattened_memories, '__len__') else 'No length'}")
-        
-        # Return all memories for the user (no filtering needed)
-        return json.dumps({
-            "user_id": userId,
-            "memories": flattened_memories,
-            "count": len(flattened_memories) if hasattr(flattened_memories, '__len__') else 0
-        }, indent=2)
-    
-    except Exception as e:
-        import traceback
-        error_details = traceback.format_exc()
-        print(f"DEBUG: Full error traceback: {error_details}")
-        return f"Error retrieving memories: {str(e)}"
-
-@mcp.tool()
+        memories = await _run_mem0(mem0_client.get_all, user_id=userId, limit=GET_ALL_MAX_MEMORIES + 1)
+    except Exception as mem0_error:
+        return f"Error calling Mem0 get_all: {str(mem0_error)}"
+    
+    flattened_memories = _flatten_memories(memories)
+    truncated = len(flattened_memories) > GET_ALL_MAX_MEMORIES
+    if truncated:
+        flattened_memories = flattened_memories[:GET_ALL_MAX_MEMORIES]
+    return flattened_memories, truncated
+
+@memory_tool("Error searching memories")
 async def search_memories(
     ctx: Context, 
     query: str, 
-    userId: str
+    userId: NonBlankStr
 ) -> str:
     """Search memories using semantic search with user isolation.
 
@@ -326,57 +534,73 @@ async def search_memories(
         query: Search query string describing what you're looking for. Can be natural language.
         userId: Required user identifier for memory isolation (must be provided)
     """
-    try:
-        # Validate required parameters
-        if not userId or userId.strip() == "":
-            return "Error: userId is required and cannot be empty"
-        
-        mem0_client = ctx.request_context.lifespan_context.mem0_client
-        
-        # Search memories with proper isolation
-        # Note: Mem0's search() method only supports query and user_id parameters
+    # Identical searches are answered from the cache until the user's memories change
+    cache_key = _search_cache.make_key(userId, query)
+    cached = _search_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    # Concurrent identical searches share one Mem0 call instead of each making their own
+    search = _inflight_searches.get(cache_key)
+    if search is None:
+        search = asyncio.ensure_future(_search_uncached(_get_mem0_client(ctx), userId, query, cache_key))
+        _inflight_searches[cache_key] = search
+        search.add_done_callback(functools.partial(_finish_inflight_search, cache_key))
+    
+    # Shielded so a caller that disconnects doesn't cancel the search for the others
+    return await asyncio.shield(search)
+
+async def _search_uncached(mem0_client: Memory, userId: str, query: str, cache_key: tuple) -> str:
+    """Run a search that missed the response cache and cache its response."""
+    # A rephrased query close enough to an earlier one reuses its results and skips the vector search
+    embedding = None
+    if _semantic_cache.enabled:
+        generation = _semantic_cache.generation(userId)
         try:
-            memories = mem0_client.search(
-                query, 
-                user_id=userId
-            )
-            print(f"DEBUG: Mem0 search returned: {type(memories)} - {memories}")
-        except Exception as mem0_error:
-            return f"Error calling Mem0 search: {str(mem0_error)}"
-        
-        # Check if memories is a string (error message) or object
-        if isinstance(memories, str):
-            return f"Error searching memories: {memories}"
-        
-        # Debug: Check the structure of what we received
-        print(f"DEBUG: Search memories type: {type(memories)}")
-        print(f"DEBUG: Search memories content: {memories}")
-        
-        if isinstance(memories, dict) and "results" in memories:
-            flattened_memories = [memory["memory"] for memory in memories["results"]]
+            embedding = await _run_mem0(mem0_client.embedding_model.embed, query, "search")
+        except Exception as embed_error:
+            debug_log("Semantic cache lookup skipped, embedding failed: %s", embed_error)
         else:
-            flattened_memories = memories
-        
-        # Debug: Check flattened memories
-        print(f"DEBUG: Flattened search memories type: {type(flattened_memories)}")
-        print(f"DEBUG: Flattened search memories length: {len(flattened_memories) if hasattr(flattened_memories, '__len__') else 'No length'}")
-        
-        # Return all search results for the user (no filtering needed)
-        return json.dumps({
-            "user_id": userId,
-            "query": query,
-            "results": flattened_memories,
-            "count": len(flattened_memories) if hasattr(flattened_memories, '__len__') else 0
-        }, indent=2)
-    
-    except Exception as e:
-        return f"Error searching memories: {str(e)}"
-
-@mcp.tool()
+            cached_results = _semantic_cache.lookup(userId, embedding)
+            if cached_results is not None:
+                response = _render_search(userId, query, cached_results)
+                _search_cache.set(cache_key, response)
+                return response
+    
+    # Search memories with proper isolation
+    # Note: Mem0's search() method only supports query and user_id parameters
+    try:
+        memories = await _run_mem0(
+            mem0_client.search,
+            query, 
+            user_id=userId
+        )
+    except Exception as mem0_error:
+        return f"Error calling Mem0 search: {str(mem0_error)}"
+    
+    flattened_memories = _flatten_memories(memories)
+    if embedding is not None:
+        _semantic_cache.store(userId, generation, embedding, flattened_memories)
+    
+    # Return all search results for the user (no filtering needed)
+    response = _render_search(userId, query, flattened_memories)
+    _search_cache.set(cache_key, response)
+    return response
+
+def _finish_inflight_search(cache_key: tuple, search: asyncio.Future):
+    """Forget a finished search so later identical queries go back to the cache."""
+    if _inflight_searches.get(cache_key) is search:
+        del _inflight_searches[cache_key]
+    
+    # Mark a failure as seen even if every caller stopped waiting for it
+    if not search.cancelled():
+        search.exception()
+
+@memory_tool("Error deleting memory")
 async def delete_memory(
     ctx: Context,
-    memoryId: str,
-    userId: str
+    memoryId: NonBlankStr,
+    userId: NonBlankStr
 ) -> str:
     """Delete a specific memory with user isolation.
 
@@ -388,27 +612,30 @@ async def delete_memory(
         memoryId: The unique identifier of the memory to delete
         userId: Required user identifier for memory isolation (must be provided)
     """
-    try:
-        # Validate required parameters
-        if not userId or userId.strip() == "":
-            return "Error: userId is required and cannot be empty"
-        if not memoryId or memoryId.strip() == "":
-            return "Error: memoryId is required and cannot be empty"
-        
-        mem0_client = ctx.request_context.lifespan_context.mem0_client
-        
-        # Note: Mem0's delete functionality may need to be implemented based on their API
-        # For now, we'll return a placeholder response
-        # TODO: Implement actual deletion when Mem0 supports it
-        
-        return f"Memory deletion requested for user '{userId}' (memoryId: {memoryId}). Note: Delete functionality may need to be implemented based on Mem0's current API support."
+    if not memoryId or memoryId.isspace():
+        return _ERR_EMPTY_MEMORY_ID
+    
+    mem0_client = _get_mem0_client(ctx)
+    _invalidate_user_caches(userId)
     
-    except Exception as e:
-        return f"Error deleting memory: {str(e)}"
+    # Note: Mem0's delete functionality may need to be implemented based on their API
+    # For now, we'll return a placeholder response
+    # TODO: Implement actual deletion when Mem0 supports it
+    
+    return f"Memory deletion requested for user '{userId}' (memoryId: {memoryId}). Note: Delete functionality may need to be implemented based on Mem0's current API support."
 
-async def cleanup_cached_client():
-    """Clean up the cached Mem0 client when the server shuts down."""
+def cleanup_cached_client():
+    """
+    Clean up the cached Mem0 client when the server shuts down.
+    
+    Deliberately synchronous: with no await points, cancelling the server on Ctrl-C
+    cannot interrupt the cleanup halfway and leave connections open.
+    """
     global _cached_mem0_client
+    
+    # Drop queued Mem0 calls; any already running finish on their own, nothing waits for them
+    _mem0_executor.shutdown(wait=False, cancel_futures=True)
+    
     if _cached_mem0_client:
         try:
             print("DEBUG: Cleaning up cached Mem0 client...")
@@ -423,7 +650,8 @@ async def cleanup_cached_client():
 
 async def main():
     # Validate configuration and show warnings
-    config_warnings = validate_config()
+    # Production deployments are validated ahead of time by validate_env.py
+    config_warnings = () if IS_PRODUCTION else validate_config()
     if config_warnings:
         print("Configuration warnings:")
         for warning in config_warnings:
@@ -445,7 +673,7 @@ async def main():
             await mcp.run_stdio_async()
     finally:
         # Clean up the cached client when the server shuts down
-        await cleanup_cached_client()
+        cleanup_cached_client()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,110 @@
+"""
+In-process cache for rendered MCP tool responses and the results they are built from.
+Entries expire after a TTL and are dropped per user whenever that user's memories change.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Set, Tuple
+
+class ResponseCache:
+    """
+    LRU cache of rendered responses (or their source data), keyed per user, with a TTL and per-user invalidation.
+    
+    Keys carry the user's generation number at the time the request started. Invalidating a
+    user bumps the generation and drops their entries, so a response computed before the
+    invalidation is never stored under the new generation.
+    """
+    
+    def __init__(self, maxsize: int = 10000, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._user_keys: Dict[str, Set[Tuple]] = {}
+    
+    @property
+    def enabled(self) -> bool:
+        """Whether caching is turned on (a TTL or size of 0 disables it)."""
+        return self.ttl > 0 and self.maxsize > 0
+    
+    def make_key(self, user_id: str, key: Hashable) -> Tuple:
+        """
+        Build the cache key for a request; call this before doing the uncached work.
+        
+        Args:
+            user_id: User the response belongs to
+            key: Request-specific part of the key (e.g. the search query)
+        
+        Returns:
+            Tuple: Key to pass to get() and set()
+        """
+        return (user_id, self._generations.get(user_id, 0), key)
+    
+    def get(self, cache_key: Tuple) -> Optional[Any]:
+        """
+        Return the cached response for a key, or None if missing or expired.
+        
+        Args:
+            cache_key: Key from make_key()
+        
+        Returns:
+            Optional[Any]: Cached value
+        """
+        if not self.enabled:
+            return None
+        
+        entry = self._entries.get(cache_key)
+        if entry is None:
+            return None
+        
+        stored_at, value = entry
+        if time.monotonic() - stored_at >= self.ttl:
+            self._discard(cache_key)
+            return None
+        
+        self._entries.move_to_end(cache_key)
+        return value
+    
+    def set(self, cache_key: Tuple, value: Any):
+        """
+        Store a response, unless the user was invalidated since the key was made.
+        
+        Args:
+            cache_key: Key from make_key()
+            value: Rendered response or data to cache
+        """
+        if not self.enabled:
+            return
+        
+        user_id, generation = cache_key[0], cache_key[1]
+        if self._generations.get(user_id, 0) != generation:
+            return
+        
+        self._entries[cache_key] = (time.monotonic(), value)
+        self._entries.move_to_end(cache_key)
+        self._user_keys.setdefault(user_id, set()).add(cache_key)
+        while len(self._entries) > self.maxsize:
+            self._discard(next(iter(self._entries)))
+    
+    def invalidate_user(self, user_id: str):
+        """
+        Forget every cached response for a user.
+        
+        Args:
+            user_id: User whose memories changed
+        """
+        self._generations[user_id] = self._generations.get(user_id, 0) + 1
+        
+        # Free the stale entries now instead of leaving them to age out of the LRU
+        for cache_key in self._user_keys.pop(user_id, ()):
+            self._entries.pop(cache_key, None)
+    
+    def _discard(self, cache_key: Tuple):
+        """Remove one entry and its place in the per-user index."""
+        del self._entries[cache_key]
+        user_keys = self._user_keys.get(cache_key[0])
+        if user_keys is not None:
+            user_keys.discard(cache_key)
+            if not user_keys:
+                del self._user_keys[cache_key[0]]
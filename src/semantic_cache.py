@@ -0,0 +1,137 @@
+"""
+Opt-in semantic cache for search_memories.
+Answers a search from an earlier one for the same user when the two query embeddings are close enough.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    # Without numpy the cache stays disabled
+    np = None
+
+class _UserEntries:
+    """Cached searches for one user: unit query embeddings stacked row-wise, with their results."""
+    
+    __slots__ = ("embeddings", "stored_at", "results")
+    
+    def __init__(self, dims: int):
+        self.embeddings = np.empty((0, dims), dtype=np.float32)
+        self.stored_at: List[float] = []
+        self.results: List[Any] = []
+
+class SemanticCache:
+    """
+    Per-user cache of search results, looked up by cosine similarity of the query embedding.
+    
+    A lookup is one matrix-vector product over the user's cached embeddings, so a hit costs an
+    embedding call but skips the vector store search. Entries are dropped when the user's
+    memories change, using the same generation scheme as ResponseCache. At most max_users
+    users are kept, the least recently used going first.
+    """
+    
+    def __init__(self, threshold: float = 0.0, max_entries_per_user: int = 128, ttl: float = 300.0,
+                 max_users: int = 1024):
+        self.threshold = threshold
+        self.max_entries_per_user = max_entries_per_user
+        self.ttl = ttl
+        self.max_users = max_users
+        self._users: "OrderedDict[str, _UserEntries]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+    
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache is turned on (needs numpy and a threshold above 0)."""
+        return (np is not None and self.threshold > 0 and self.max_entries_per_user > 0
+                and self.max_users > 0 and self.ttl > 0)
+    
+    def generation(self, user_id: str) -> int:
+        """Return the user's current generation; pass it to store() after the search completes."""
+        return self._generations.get(user_id, 0)
+    
+    def lookup(self, user_id: str, embedding: List[float]) -> Optional[Any]:
+        """
+        Return the results of the most similar cached search, if it is similar enough.
+        
+        Args:
+            user_id: User the search belongs to
+            embedding: Embedding of the new query
+        
+        Returns:
+            Optional[Any]: Cached results, or None on a miss
+        """
+        entries = self._users.get(user_id)
+        if entries is None or not entries.results:
+            return None
+        
+        query = self._normalize(embedding)
+        if query is None or query.shape[0] != entries.embeddings.shape[1]:
+            return None
+        
+        self._users.move_to_end(user_id)
+        
+        # Expired rows can't win, even when they are the closest match
+        similarities = entries.embeddings @ query
+        expired = np.asarray(entries.stored_at) <= time.monotonic() - self.ttl
+        similarities[expired] = -np.inf
+        best = int(similarities.argmax())
+        if similarities[best] < self.threshold:
+            return None
+        return entries.results[best]
+    
+    def store(self, user_id: str, generation: int, embedding: List[float], results: Any):
+        """
+        Remember the results of a search, unless the user was invalidated since it started.
+        
+        Args:
+            user_id: User the search belongs to
+            generation: Value of generation() taken before the search ran
+            embedding: Embedding of the query
+            results: Search results to return for similar queries
+        """
+        if generation != self.generation(user_id):
+            return
+        
+        query = self._normalize(embedding)
+        if query is None:
+            return
+        
+        entries = self._users.get(user_id)
+        if entries is None or entries.embeddings.shape[1] != query.shape[0]:
+            entries = self._users[user_id] = _UserEntries(query.shape[0])
+        self._users.move_to_end(user_id)
+        while len(self._users) > self.max_users:
+            self._users.popitem(last=False)
+        
+        # Rows are in insertion order, so the expired ones are a prefix; drop them, then
+        # the oldest live rows once the user's share is full
+        now = time.monotonic()
+        start = 0
+        while start < len(entries.stored_at) and now - entries.stored_at[start] >= self.ttl:
+            start += 1
+        start = max(start, len(entries.stored_at) - (self.max_entries_per_user - 1))
+        entries.embeddings = np.vstack((entries.embeddings[start:], query))
+        entries.stored_at = entries.stored_at[start:] + [now]
+        entries.results = entries.results[start:] + [results]
+    
+    def invalidate_user(self, user_id: str):
+        """
+        Forget every cached search for a user.
+        
+        Args:
+            user_id: User whose memories changed
+        """
+        self._generations[user_id] = self._generations.get(user_id, 0) + 1
+        self._users.pop(user_id, None)
+    
+    @staticmethod
+    def _normalize(embedding: List[float]):
+        """Return the embedding as a unit float32 vector, or None if it has no direction."""
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return None
+        return vector / norm
@@ -117,13 +117,13 @@ def get_mem0_client():
         embedding_model = os.getenv('EMBEDDING_MODEL_CHOICE')
         embedding_api_key = os.getenv('EMBEDDING_API_KEY')
         
-        debug_log(f"LLM_PROVIDER: {llm_provider}")
-        debug_log(f"LLM_CHOICE: {llm_model}")
-        debug_log(f"EMBEDDING_MODEL_CHOICE: {embedding_model}")
-        debug_log(f"LLM_BASE_URL: {os.getenv('LLM_BASE_URL')}")
-        debug_log(f"DATABASE_URL: {'SET' if os.getenv('DATABASE_URL') else 'NOT SET'}")
-        debug_log(f"LLM_MAX_TOKENS: {LLM_MAX_TOKENS}")
-        debug_log(f"LLM_CONTEXT_LENGTH: {LLM_CONTEXT_LENGTH}")
+        debug_log("LLM_PROVIDER: %s", llm_provider)
+        debug_log("LLM_CHOICE: %s", llm_model)
+        debug_log("EMBEDDING_MODEL_CHOICE: %s", embedding_model)
+        debug_log("LLM_BASE_URL: %s", os.getenv('LLM_BASE_URL'))
+        debug_log("DATABASE_URL: %s", 'SET' if os.getenv('DATABASE_URL') else 'NOT SET')
+        debug_log("LLM_MAX_TOKENS: %s", LLM_MAX_TOKENS)
+        debug_log("LLM_CONTEXT_LENGTH: %s", LLM_CONTEXT_LENGTH)
         
         # Validate required environment variables
         if not llm_provider:
@@ -156,7 +156,7 @@ def get_mem0_client():
             if llm_base_url:
                 # Set in environment for Mem0 internal use (LLM config doesn't support base_url)
                 os.environ["OPENAI_BASE_URL"] = llm_base_url
-                debug_log(f"Set custom OpenAI base URL: {llm_base_url}")
+                debug_log("Set custom OpenAI base URL: %s", llm_base_url)
             
             # Set API key in environment if not already set
             # Handle empty API keys (for servers that don't require authentication)
@@ -201,7 +201,7 @@ def get_mem0_client():
             # Set base URL without query parameter (Mem0 will add /chat/completions)
             os.environ["OPENAI_BASE_URL"] = azure_base_url
             os.environ["OPENAI_API_VERSION"] = AZURE_OPENAI_API_VERSION
-            debug_log(f"Configured Azure OpenAI through OpenAI client: {azure_base_url}")
+            debug_log("Configured Azure OpenAI through OpenAI client: %s", azure_base_url)
             
             config["llm"] = {
                 "provider": "openai",
@@ -225,7 +225,7 @@ def get_mem0_client():
             for key in ['OPENAI_API_KEY', 'OPENAI_BASE_URL', 'OPENAI_ORGANIZATION']:
                 if key in os.environ:
                     del os.environ[key]
-                    debug_log(f"Cleared {key} environment variable for Ollama configuration")
+                    debug_log("Cleared %s environment variable for Ollama configuration", key)
         elif llm_provider == 'ollama' and embedding_provider == 'openai':
             debug_log("Mixed configuration - LLM using Ollama, Embedder using OpenAI")
             debug_log("Keeping OpenAI environment variables for embedder")
@@ -235,15 +235,15 @@ def get_mem0_client():
                 # Ensure the URL has a protocol
                 if not embedding_base_url.startswith(('http://', 'https://')):
                     embedding_base_url = f"http://{embedding_base_url}"
-                    debug_log(f"Added http:// protocol to embedding URL: {embedding_base_url}")
+                    debug_log("Added http:// protocol to embedding URL: %s", embedding_base_url)
                 
                 os.environ["OPENAI_BASE_URL"] = embedding_base_url
-                debug_log(f"Set OpenAI base URL for mixed configuration: {embedding_base_url}")
+                debug_log("Set OpenAI base URL for mixed configuration: %s", embedding_base_url)
         elif llm_provider == 'openai':
             # For OpenAI, ensure we're using the custom base URL if provided
             llm_base_url = os.getenv('LLM_BASE_URL')
             if llm_base_url and 'api.openai.com' not in llm_base_url:
-                debug_log(f"Will use custom OpenAI endpoint via environment: {llm_base_url}")
+                debug_log("Will use custom OpenAI endpoint via environment: %s", llm_base_url)
             else:
                 debug_log("Will use default OpenAI endpoint (api.openai.com)")
         
@@ -263,11 +263,11 @@ def get_mem0_client():
                 # Ensure the URL has a protocol
                 if not embedding_base_url.startswith(('http://', 'https://')):
                     embedding_base_url = f"http://{embedding_base_url}"
-                    debug_log(f"Added http:// protocol to embedding URL: {embedding_base_url}")
+                    debug_log("Added http:// protocol to embedding URL: %s", embedding_base_url)
                 
                 # Set in environment for Mem0 internal use (embedder doesn't support base_url in config)
                 os.environ["OPENAI_BASE_URL"] = embedding_base_url
-                debug_log(f"Set custom OpenAI base URL for embedder: {embedding_base_url}")
+                debug_log("Set custom OpenAI base URL for embedder: %s", embedding_base_url)
                 if os.getenv('EMBEDDING_BASE_URL'):
                     debug_log("Using dedicated EMBEDDING_BASE_URL")
                 else:
@@ -280,30 +280,30 @@ def get_mem0_client():
                 os.environ["OPENAI_API_KEY"] = api_key_to_use
                 if embedding_api_key is not None:
                     if embedding_api_key.strip() == "":
-                        debug_log(f"Using empty EMBEDDING_API_KEY for embeddings (server may not require authentication)")
+                        debug_log("Using empty EMBEDDING_API_KEY for embeddings (server may not require authentication)")
                     else:
-                        debug_log(f"Using dedicated EMBEDDING_API_KEY for embeddings")
+                        debug_log("Using dedicated EMBEDDING_API_KEY for embeddings")
                 else:
                     if llm_api_key and llm_api_key.strip() == "":
-                        debug_log(f"Using empty LLM_API_KEY for embeddings (server may not require authentication)")
+                        debug_log("Using empty LLM_API_KEY for embeddings (server may not require authentication)")
                     else:
-                        debug_log(f"Using LLM_API_KEY for embeddings")
+                        debug_log("Using LLM_API_KEY for embeddings")
         
         elif embedding_provider == 'ollama':
             # Map OpenAI model names to appropriate Ollama models if there's a mismatch
             if embedding_model and 'text-embedding' in embedding_model.lower():
-                debug_log(f"Detected OpenAI model name '{embedding_model}' with Ollama provider")
+                debug_log("Detected OpenAI model name '%s' with Ollama provider", embedding_model)
                 debug_log("Mapping to appropriate Ollama embedding model")
                 # Map common OpenAI embedding models to Ollama equivalents
                 if 'text-embedding-3-small' in embedding_model.lower():
                     embedding_model = "nomic-embed-text"
-                    debug_log(f"Mapped to Ollama model: {embedding_model}")
+                    debug_log("Mapped to Ollama model: %s", embedding_model)
                 elif 'text-embedding-3-large' in embedding_model.lower():
                     embedding_model = "nomic-embed-text"
-                    debug_log(f"Mapped to Ollama model: {embedding_model}")
+                    debug_log("Mapped to Ollama model: %s", embedding_model)
                 else:
                     embedding_model = "nomic-embed-text"
-                    debug_log(f"Mapped to default Ollama model: {embedding_model}")
+                    debug_log("Mapped to default Ollama model: %s", embedding_model)
             
             config["embedder"] = {
                 "provider": "ollama",
@@ -319,7 +319,7 @@ def get_mem0_client():
                 config["embedder"]["config"]["ollama_base_url"] = embedding_base_url
                 # Also set the base URL in environment for Mem0 internal use
                 os.environ["OLLAMA_BASE_URL"] = embedding_base_url
-                debug_log(f"Set OLLAMA_BASE_URL for embedder: {embedding_base_url}")
+                debug_log("Set OLLAMA_BASE_URL for embedder: %s", embedding_base_url)
                 if os.getenv('EMBEDDING_BASE_URL'):
                     debug_log("Using dedicated EMBEDDING_BASE_URL for Ollama")
                 else:
@@ -342,7 +342,7 @@ def get_mem0_client():
                 if embedding_base_url:
                     # Set in environment for Mem0 internal use (embedder doesn't support base_url in config)
                     os.environ["OPENAI_BASE_URL"] = embedding_base_url
-                    debug_log(f"Set custom OpenAI base URL for embedder (fallback): {embedding_base_url}")
+                    debug_log("Set custom OpenAI base URL for embedder (fallback): %s", embedding_base_url)
                     if os.getenv('EMBEDDING_BASE_URL'):
                         debug_log("Using dedicated EMBEDDING_BASE_URL (fallback)")
                     else:
@@ -355,14 +355,14 @@ def get_mem0_client():
                     os.environ["OPENAI_API_KEY"] = api_key_to_use
                     if embedding_api_key is not None:
                         if embedding_api_key.strip() == "":
-                            debug_log(f"Using empty EMBEDDING_API_KEY for embeddings (fallback - server may not require authentication)")
+                            debug_log("Using empty EMBEDDING_API_KEY for embeddings (fallback - server may not require authentication)")
                         else:
-                            debug_log(f"Using dedicated EMBEDDING_API_KEY for embeddings (fallback)")
+                            debug_log("Using dedicated EMBEDDING_API_KEY for embeddings (fallback)")
                     else:
                         if llm_api_key and llm_api_key.strip() == "":
-                            debug_log(f"Using empty LLM_API_KEY for embeddings (fallback - server may not require authentication)")
+                            debug_log("Using empty LLM_API_KEY for embeddings (fallback - server may not require authentication)")
                         else:
-                            debug_log(f"Using LLM_API_KEY for embeddings (fallback)")
+                            debug_log("Using LLM_API_KEY for embeddings (fallback)")
             
             elif llm_provider == 'ollama':
                 config["embedder"] = {
@@ -379,7 +379,7 @@ def get_mem0_client():
                     config["embedder"]["config"]["ollama_base_url"] = embedding_base_url
                     # Also set the base URL in environment for Mem0 internal use
                     os.environ["OLLAMA_BASE_URL"] = embedding_base_url
-                    debug_log(f"Set OLLAMA_BASE_URL for embedder (fallback): {embedding_base_url}")
+                    debug_log("Set OLLAMA_BASE_URL for embedder (fallback): %s", embedding_base_url)
         
         # Configure Supabase vector store
         database_url = os.environ.get('DATABASE_URL')
@@ -400,36 +400,36 @@ def get_mem0_client():
 
         # config["custom_fact_extraction_prompt"] = CUSTOM_INSTRUCTIONS
         
-        debug_log(f"Final Mem0 config: {config}")
+        debug_log("Final Mem0 config: %s", config)
         debug_log("Creating Mem0 client...")
         
         # Additional debugging for environment variables
-        debug_log(f"Environment check - OPENAI_API_KEY: {'SET' if os.environ.get('OPENAI_API_KEY') else 'NOT SET'}")
-        debug_log(f"Environment check - OPENAI_BASE_URL: {'SET' if os.environ.get('OPENAI_BASE_URL') else 'NOT SET'}")
-        debug_log(f"Environment check - LLM_BASE_URL: {os.environ.get('LLM_BASE_URL', 'NOT SET')}")
+        debug_log("Environment check - OPENAI_API_KEY: %s", 'SET' if os.environ.get('OPENAI_API_KEY') else 'NOT SET')
+        debug_log("Environment check - OPENAI_BASE_URL: %s", 'SET' if os.environ.get('OPENAI_BASE_URL') else 'NOT SET')
+        debug_log("Environment check - LLM_BASE_URL: %s", os.environ.get('LLM_BASE_URL', 'NOT SET'))
         
         # Debug embedder config specifically
         if "embedder" in config:
-            debug_log(f"Embedder config: {config['embedder']}")
+            debug_log("Embedder config: %s", config['embedder'])
             if "config" in config["embedder"]:
-                debug_log(f"Embedder config details: {config['embedder']['config']}")
+                debug_log("Embedder config details: %s", config['embedder']['config'])
         
         # Create and return the Memory client
         try:
             client = Memory.from_config(config)
-            debug_log(f"Mem0 client created successfully: {type(client)}")
+            debug_log("Mem0 client created successfully: %s", type(client))
             
             # Test the client configuration by checking its internal state
             if hasattr(client, '_llm') and hasattr(client._llm, 'client'):
-                debug_log(f"Mem0 LLM client type: {type(client._llm.client)}")
+                debug_log("Mem0 LLM client type: %s", type(client._llm.client))
             if hasattr(client, '_embedder') and hasattr(client._embedder, 'client'):
-                debug_log(f"Mem0 Embedder client type: {type(client._embedder.client)}")
+                debug_log("Mem0 Embedder client type: %s", type(client._embedder.client))
             
             return client
         except Exception as e:
-            debug_log(f"Error creating Mem0 client: {e}")
-            debug_log(f"Error type: {type(e)}")
-            debug_log(f"Error args: {e.args}")
+            debug_log("Error creating Mem0 client: %s", e)
+            debug_log("Error type: %s", type(e))
+            debug_log("Error args: %s", e.args)
             raise
         
     except Exception as e:
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Validate environment files against the mcp-mem0 configuration rules.
+
+Runs the same checks as config.validate_config() ahead of time, e.g. as a
+pre-commit hook or CI step, so production deployments can skip them at startup.
+Exits non-zero if any file produces a warning.
+
+Usage:
+    python validate_env.py [env_file ...]    (defaults to .env)
+"""
+
+import os
+import sys
+import importlib
+from pathlib import Path
+
+from dotenv import dotenv_values
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+def validate_env_file(env_file: Path) -> tuple[str, ...]:
+    """
+    Validate a single environment file.
+    
+    Args:
+        env_file: Path to the environment file
+        
+    Returns:
+        Tuple of configuration warnings or errors (empty if valid)
+    """
+    values = {key: value for key, value in dotenv_values(env_file).items() if value is not None}
+    
+    # config reads os.environ at import time, so swap the file's values in and reload it
+    saved_environ = os.environ.copy()
+    try:
+        os.environ.clear()
+        os.environ.update(values)
+        import config
+        config = importlib.reload(config)
+        return config.validate_config()
+    except ValueError as e:
+        return (f"ERROR: Invalid value in {env_file}: {e}",)
+    finally:
+        os.environ.clear()
+        os.environ.update(saved_environ)
+
+def main() -> int:
+    """Validate every file given on the command line."""
+    env_files = [Path(arg) for arg in sys.argv[1:]] or [Path('.env')]
+    
+    failed = False
+    for env_file in env_files:
+        if not env_file.exists():
+            print(f"❌ {env_file} file not found!")
+            failed = True
+            continue
+        
+        warnings = validate_env_file(env_file)
+        if warnings:
+            failed = True
+            print(f"❌ {env_file}:")
+            for warning in warnings:
+                print(f"  {warning}")
+        else:
+            print(f"✅ {env_file}: configuration is valid")
+    
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())